@@ -5,11 +5,12 @@ autonomous agents with standardized execution, monitoring, and state
 management capabilities.
 """
 
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from loguru import logger
 
 # Get current UTC time in a timezone-aware manner
@@ -35,7 +36,7 @@ class AgentPriority(int, Enum):
     LOW = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMetrics:
     """Metrics tracked for each agent execution."""
     total_runs: int = 0
@@ -45,6 +46,10 @@ class AgentMetrics:
     last_run_start: Optional[datetime] = None
     last_run_end: Optional[datetime] = None
     last_error: Optional[str] = None
+    # Formatted (success_rate, average_duration) keyed on the values they derive from
+    _formatted: Optional[Tuple[Tuple[int, int, float], str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def success_rate(self) -> float:
@@ -60,15 +65,32 @@ class AgentMetrics:
             return 0.0
         return self.total_duration_seconds / self.total_runs
 
+    def formatted_rates(self) -> Tuple[str, str]:
+        """Get display strings for success rate and average duration.
 
-@dataclass
+        The strings are only re-rendered when the underlying counters change.
+
+        Returns:
+            Tuple of (success_rate, average_duration), e.g. ("75.0%", "1.25s")
+        """
+        key = (self.total_runs, self.successful_runs, self.total_duration_seconds)
+        if self._formatted is None or self._formatted[0] != key:
+            self._formatted = (
+                key,
+                f"{self.success_rate:.1f}%",
+                f"{self.average_duration:.2f}s",
+            )
+        return self._formatted[1], self._formatted[2]
+
+
+@dataclass(slots=True)
 class AgentResult:
     """Result of agent execution."""
     success: bool
     message: str
     metrics: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
 
     def __repr__(self) -> str:
         status = "✓" if self.success else "✗"
@@ -97,11 +119,15 @@ class Agent(ABC):
             enabled: Whether the agent should run
         """
         self.name = name
+        # Called when the priority or dependencies change, so chains holding
+        # this agent can drop their cached execution order
+        self._change_listeners: List[Callable[[], None]] = []
         self.priority = priority
         self.enabled = enabled
         self.state = AgentState.IDLE
         self.metrics = AgentMetrics()
-        self._dependencies: List[str] = []
+        # Insertion-ordered set of dependency names (dict keys give O(1) membership)
+        self._dependencies: Dict[str, None] = {}
         logger.info(f"Initialized agent: {name} (priority={priority.name})")
 
     def register_dependency(self, agent_name: str) -> None:
@@ -110,13 +136,28 @@ class Agent(ABC):
         Args:
             agent_name: Name of the agent this agent depends on
         """
-        if agent_name not in self._dependencies:
-            self._dependencies.append(agent_name)
+        self._dependencies[agent_name] = None
+        self._notify_change()
+
+    @property
+    def priority(self) -> AgentPriority:
+        """Execution priority level."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: AgentPriority) -> None:
+        self._priority = value
+        self._notify_change()
+
+    def _notify_change(self) -> None:
+        """Tell every registered listener that the ordering inputs changed."""
+        for listener in self._change_listeners:
+            listener()
 
     @property
     def dependencies(self) -> List[str]:
         """Get list of agent dependencies."""
-        return self._dependencies.copy()
+        return list(self._dependencies)
 
     @abstractmethod
     async def run(self) -> AgentResult:
@@ -158,6 +199,7 @@ class Agent(ABC):
         Returns:
             Dictionary containing state, metrics, and status information
         """
+        success_rate, average_duration = self.metrics.formatted_rates()
         return {
             "name": self.name,
             "state": self.state.value,
@@ -167,14 +209,14 @@ class Agent(ABC):
                 "total_runs": self.metrics.total_runs,
                 "successful_runs": self.metrics.successful_runs,
                 "failed_runs": self.metrics.failed_runs,
-                "success_rate": f"{self.metrics.success_rate:.1f}%",
-                "average_duration": f"{self.metrics.average_duration:.2f}s",
+                "success_rate": success_rate,
+                "average_duration": average_duration,
                 "last_run": self.metrics.last_run_end.isoformat()
                 if self.metrics.last_run_end
                 else None,
                 "last_error": self.metrics.last_error,
             },
-            "dependencies": self._dependencies,
+            "dependencies": list(self._dependencies),
         }
 
 
@@ -185,6 +227,11 @@ class AgentChain:
         """Initialize agent chain."""
         self.agents: Dict[str, Agent] = {}
         self.execution_order: List[str] = []
+        self._order_cache: Optional[List[str]] = None
+        # Bumped whenever the agents, their priorities or their dependencies
+        # change; the cached order is valid only for the version it was built at
+        self._version = 0
+        self._order_version = -1
 
     def register(self, agent: Agent) -> None:
         """Register an agent in the chain.
@@ -199,8 +246,32 @@ class AgentChain:
             raise ValueError(f"Agent '{agent.name}' already registered")
 
         self.agents[agent.name] = agent
+        agent._change_listeners.append(self._invalidate_order)
+        self._invalidate_order()
         logger.debug(f"Registered agent: {agent.name}")
 
+    def unregister(self, agent_name: str) -> bool:
+        """Remove an agent from the chain.
+
+        Args:
+            agent_name: Name of the agent to remove
+
+        Returns:
+            True if the agent was removed, False if not found
+        """
+        if agent_name not in self.agents:
+            return False
+
+        agent = self.agents.pop(agent_name)
+        agent._change_listeners.remove(self._invalidate_order)
+        self._invalidate_order()
+        logger.debug(f"Unregistered agent: {agent_name}")
+        return True
+
+    def _invalidate_order(self) -> None:
+        """Mark the cached execution order as stale."""
+        self._version += 1
+
     def _resolve_execution_order(self) -> List[str]:
         """Resolve execution order based on dependencies.
 
@@ -212,32 +283,36 @@ class AgentChain:
         Raises:
             ValueError: If circular dependencies are detected
         """
-        in_degree = {name: 0 for name in self.agents}
-        graph: Dict[str, List[str]] = {name: [] for name in self.agents}
+        # Intern agent names to integer indices for list-based lookups
+        names = list(self.agents)
+        index = {name: i for i, name in enumerate(names)}
+        priorities = [self.agents[name].priority.value for name in names]
+        in_degree = [0] * len(names)
+        graph: List[List[int]] = [[] for _ in names]
 
         # Build dependency graph
         for name, agent in self.agents.items():
             for dep in agent.dependencies:
-                if dep in self.agents:
-                    graph[dep].append(name)
-                    in_degree[name] += 1
+                if dep in index:
+                    graph[index[dep]].append(index[name])
+                    in_degree[index[name]] += 1
                 else:
                     logger.warning(f"Agent '{name}' depends on unknown agent '{dep}'")
 
-        # Topological sort using Kahn's algorithm
-        queue = [name for name in self.agents if in_degree[name] == 0]
+        # Topological sort using Kahn's algorithm with a min-heap keyed on
+        # (priority, name): lower number = higher priority, name breaks ties
+        heap = [(priorities[i], names[i], i) for i in range(len(names)) if in_degree[i] == 0]
+        heapq.heapify(heap)
         result = []
 
-        while queue:
-            # Sort by priority (lower number = higher priority)
-            queue.sort(key=lambda n: self.agents[n].priority.value)
-            node = queue.pop(0)
-            result.append(node)
+        while heap:
+            _, name, node = heapq.heappop(heap)
+            result.append(name)
 
             for neighbor in graph[node]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                    heapq.heappush(heap, (priorities[neighbor], names[neighbor], neighbor))
 
         if len(result) != len(self.agents):
             raise ValueError("Circular dependency detected in agent chain")
@@ -247,13 +322,20 @@ class AgentChain:
     async def execute(self, agent_name: Optional[str] = None) -> List[AgentResult]:
         """Execute agents in dependency order.
 
+        The resolved order is cached until the agents, their priorities or
+        their dependencies change, so steady-state calls skip the topological
+        sort.
+
         Args:
             agent_name: If specified, execute only this agent and its dependents
 
         Returns:
             List of AgentResult objects in execution order
         """
-        self.execution_order = self._resolve_execution_order()
+        if self._order_cache is None or self._order_version != self._version:
+            self._order_cache = self._resolve_execution_order()
+            self._order_version = self._version
+        self.execution_order = self._order_cache
         results = []
 
         # Filter agents if specific agent requested
@@ -264,37 +346,37 @@ class AgentChain:
                 return []
             agents_to_run = [agent_name]
 
+        # Drop disabled agents up front rather than checking inside the loop
+        agents_to_run = [name for name in agents_to_run if self.agents[name].enabled]
+
         for agent_name in agents_to_run:
             agent = self.agents[agent_name]
 
-            if not agent.enabled:
-                logger.debug(f"Skipping disabled agent: {agent_name}")
-                continue
-
-            logger.info(f"Executing agent: {agent_name}")
+            logger.info("Executing agent: {}", agent_name)
             agent.state = AgentState.RUNNING
 
             try:
                 result = await agent.run()
                 results.append(result)
+                now = utc_now()
 
                 # Update metrics
                 agent.metrics.total_runs += 1
                 agent.metrics.last_run_start = result.timestamp
-                agent.metrics.last_run_end = utc_now()
+                agent.metrics.last_run_end = now
 
                 if result.success:
                     agent.metrics.successful_runs += 1
                     agent.state = AgentState.COMPLETED
-                    logger.info(f"Agent {agent_name} completed: {result.message}")
+                    logger.info("Agent {} completed: {}", agent_name, result.message)
                 else:
                     agent.metrics.failed_runs += 1
                     agent.metrics.last_error = result.error
                     agent.state = AgentState.FAILED
-                    logger.warning(f"Agent {agent_name} failed: {result.error}")
+                    logger.warning("Agent {} failed: {}", agent_name, result.error)
 
             except Exception as e:
-                logger.exception(f"Unexpected error in agent {agent_name}: {e}")
+                logger.exception("Unexpected error in agent {}: {}", agent_name, e)
                 agent.state = AgentState.FAILED
                 agent.metrics.failed_runs += 1
                 agent.metrics.last_error = str(e)
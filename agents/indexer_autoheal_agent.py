@@ -4,7 +4,8 @@ The main autonomous agent that monitors indexer health, records results,
 and automatically disables failing indexers to prevent service degradation.
 """
 
-from typing import Any
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 from db.session import SessionLocal
 from db.models import IndexerHealth
@@ -24,13 +25,24 @@ class IndexerAutoHealAgent(Agent):
     This agent makes actual changes to indexer state and should be
     configured with appropriate logging and alerting.
     
+    Radarr and Sonarr are healed concurrently, and indexer tests within a
+    service run concurrently, bounded by ``max_concurrency`` to avoid
+    overloading the Arr API.
+    
     Args:
         radarr: RadarrService instance
         sonarr: SonarrService instance
         control_agent: IndexerControlAgent instance for state changes
+        max_concurrency: Maximum number of indexer tests in flight at once
     """
 
-    def __init__(self, radarr: Any, sonarr: Any, control_agent: Any) -> None:
+    def __init__(
+        self,
+        radarr: Any,
+        sonarr: Any,
+        control_agent: Any,
+        max_concurrency: int = 8,
+    ) -> None:
         super().__init__(
             name="IndexerAutoHealAgent",
             priority=AgentPriority.CRITICAL,
@@ -39,6 +51,7 @@ class IndexerAutoHealAgent(Agent):
         self.radarr = radarr
         self.sonarr = sonarr
         self.control = control_agent
+        self.max_concurrency = max_concurrency
         logger.info("Initialized IndexerAutoHealAgent")
 
     async def run(self) -> AgentResult:
@@ -52,91 +65,35 @@ class IndexerAutoHealAgent(Agent):
         """
         logger.info("Starting autoheal cycle")
         
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        health_rows: List[Dict[str, Any]] = []
+        
+        # Radarr and Sonarr are independent, so heal them concurrently
+        service_counts = await asyncio.gather(
+            self._heal_service(semaphore, "radarr", self.radarr, health_rows),
+            self._heal_service(semaphore, "sonarr", self.sonarr, health_rows),
+        )
+        metrics = {
+            key: sum(counts[key] for counts in service_counts)
+            for key in ("total_tested", "total_passed", "total_failed", "total_disabled")
+        }
+        
         async with SessionLocal() as session:
-            total_tested = 0
-            total_passed = 0
-            total_failed = 0
-            total_disabled = 0
-            
-            for service_name, service in [
-                ("radarr", self.radarr),
-                ("sonarr", self.sonarr),
-            ]:
-                try:
-                    indexers = await service.get_indexers()
-                except Exception as e:
-                    logger.error(f"Failed to fetch {service_name} indexers: {e}")
-                    continue
-
-                logger.debug(f"Testing {len(indexers)} {service_name} indexers")
-                
-                for idx in indexers:
-                    total_tested += 1
-                    indexer_id = idx.get("id")
-                    indexer_name = idx.get("name", f"unknown (id={indexer_id})")
-                    
-                    try:
-                        await service.test_indexer(indexer_id)
-                        
-                        # Record successful test
-                        session.add(
-                            IndexerHealth(
-                                service=service_name,
-                                indexer_id=indexer_id,
-                                name=indexer_name,
-                                success=True,
-                                error=None,
-                            )
-                        )
-                        logger.debug(f"{service_name}/{indexer_name} passed health check")
-                        total_passed += 1
-                        
-                    except Exception as e:
-                        error_msg = str(e)[:200]  # Truncate long error messages
-                        total_failed += 1
-                        
-                        # Record failed test
-                        session.add(
-                            IndexerHealth(
-                                service=service_name,
-                                indexer_id=indexer_id,
-                                name=indexer_name,
-                                success=False,
-                                error=error_msg,
-                            )
-                        )
-                        logger.warning(
-                            f"{service_name}/{indexer_name} failed health check: {error_msg}"
-                        )
-                        
-                        # Attempt to disable the failing indexer
-                        try:
-                            await self.control.disable_indexer(service, idx)
-                            total_disabled += 1
-                        except Exception as disable_error:
-                            logger.error(
-                                f"Failed to disable {service_name}/{indexer_name}: {disable_error}"
-                            )
-
-            # Commit all database changes
+            # Write all health records in a single bulk INSERT and commit
             try:
+                await IndexerHealth.bulk_insert(session, health_rows)
                 await session.commit()
                 message = (
-                    f"Autoheal cycle completed: {total_tested} tested, "
-                    f"{total_passed} passed, {total_failed} failed, "
-                    f"{total_disabled} disabled"
+                    f"Autoheal cycle completed: {metrics['total_tested']} tested, "
+                    f"{metrics['total_passed']} passed, {metrics['total_failed']} failed, "
+                    f"{metrics['total_disabled']} disabled"
                 )
                 logger.info(message)
                 
                 return AgentResult(
                     success=True,
                     message=message,
-                    metrics={
-                        "total_tested": total_tested,
-                        "total_passed": total_passed,
-                        "total_failed": total_failed,
-                        "total_disabled": total_disabled,
-                    }
+                    metrics=metrics,
                 )
             except Exception as e:
                 logger.error(f"Failed to commit autoheal results to database: {e}")
@@ -146,10 +103,121 @@ class IndexerAutoHealAgent(Agent):
                     success=False,
                     message="Autoheal cycle failed during database commit",
                     error=str(e),
-                    metrics={
-                        "total_tested": total_tested,
-                        "total_passed": total_passed,
-                        "total_failed": total_failed,
-                        "total_disabled": total_disabled,
-                    }
+                    metrics=metrics,
+                )
+
+    async def _heal_service(
+        self,
+        semaphore: asyncio.Semaphore,
+        service_name: str,
+        service: Any,
+        health_rows: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Test every indexer of one service and disable the failing ones.
+        
+        Args:
+            semaphore: Semaphore bounding concurrent indexer tests
+            service_name: Service name used in health records (e.g., "radarr")
+            service: Service instance (RadarrService or SonarrService)
+            health_rows: Shared list that IndexerHealth row mappings are appended to
+            
+        Returns:
+            Dictionary of tested/passed/failed/disabled counts for this service
+        """
+        counts = {
+            "total_tested": 0,
+            "total_passed": 0,
+            "total_failed": 0,
+            "total_disabled": 0,
+        }
+        
+        try:
+            indexers = await service.get_indexers()
+        except Exception as e:
+            logger.error(f"Failed to fetch {service_name} indexers: {e}")
+            return counts
+
+        logger.debug("Testing {} {} indexers", len(indexers), service_name)
+        
+        results = await asyncio.gather(
+            *[
+                self._check_one(semaphore, service_name, service, idx)
+                for idx in indexers
+            ],
+            return_exceptions=True,
+        )
+        
+        for idx, outcome in zip(indexers, results, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Unexpected error testing {} indexer {}: {}",
+                    service_name,
+                    idx.get("id"),
+                    outcome,
                 )
+                continue
+            
+            row, should_disable = outcome
+            counts["total_tested"] += 1
+            health_rows.append(row)
+            
+            if not should_disable:
+                counts["total_passed"] += 1
+                continue
+            
+            counts["total_failed"] += 1
+            
+            # Attempt to disable the failing indexer
+            try:
+                await self.control.disable_indexer(service, idx)
+                counts["total_disabled"] += 1
+            except Exception as disable_error:
+                logger.error(
+                    "Failed to disable {}/{}: {}", service_name, row["name"], disable_error
+                )
+        
+        return counts
+
+    async def _check_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        service_name: str,
+        service: Any,
+        idx: dict,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Test a single indexer and build its health record row.
+        
+        Args:
+            semaphore: Semaphore bounding concurrent indexer tests
+            service_name: Service name used in the health record (e.g., "radarr")
+            service: Service instance with a test_indexer() method
+            idx: Indexer dictionary (as returned by get_indexers)
+            
+        Returns:
+            Tuple of (IndexerHealth row mapping, whether the indexer should be disabled)
+        """
+        indexer_id = idx.get("id")
+        indexer_name = idx.get("name", f"unknown (id={indexer_id})")
+        error_msg: Optional[str] = None
+        
+        async with semaphore:
+            try:
+                await service.test_indexer(indexer_id)
+            except Exception as e:
+                error_msg = str(e)[:200]  # Truncate long error messages
+        
+        if error_msg is None:
+            logger.debug("{}/{} passed health check", service_name, indexer_name)
+        else:
+            logger.warning(
+                "{}/{} failed health check: {}", service_name, indexer_name, error_msg
+            )
+        
+        row = {
+            "service": service_name,
+            "indexer_id": indexer_id,
+            "name": indexer_name,
+            "success": error_msg is None,
+            "error": error_msg,
+        }
+        return row, error_msg is not None
@@ -7,29 +7,159 @@ either a JSON array of indexer objects or a plain text list of base URLs.
 This agent is conservative by default (must enable `discovery_add_to_prowlarr`
 in settings to allow automatic adds).
 """
-from typing import Any, List, Dict
-import json
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional
+import asyncio
+import re
+import time
 import httpx
 from loguru import logger
+from pydantic_core import from_json
 
 from config.settings import settings
 from agents.base import Agent, AgentResult, AgentPriority
 
+# Shared HTTP client for discovery fetches, reused across sources and runs
+_client: Optional[httpx.AsyncClient] = None
+
+# JSON bodies at least this large (or of unknown length) are decoded item by
+# item as they stream in, instead of being buffered and decoded in one go
+_STREAM_JSON_THRESHOLD = 1024 * 1024
+
+# Characters that change the structure of a streamed JSON array: string
+# quotes and escapes, and brackets
+_JSON_STRUCTURE = re.compile(r'[\\"{}\[\]]')
+
+# A non-blank, non-comment line of a plain text source, without surrounding blanks
+_TEXT_LINE = re.compile(r"^[ \t]*([^\s#].*?)[ \t\r]*$", re.MULTILINE)
+
+
+class _ArraySplitter:
+    """Split a streamed top-level JSON array into the raw text of its items.
+
+    Each character is scanned once, skipping ahead between structural
+    characters, and an item's text is only joined and decoded once it is
+    complete, so large items and bodies cost linear time. Number, boolean
+    and null items are skipped, as discovery ignores them.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "parts", "finished")
+
+    def __init__(self) -> None:
+        self.depth = 0  # Bracket depth inside the current item
+        self.in_string = False
+        self.escaped = False  # Previous chunk ended on a backslash in a string
+        self.parts: Optional[List[str]] = None  # Text of the item in progress
+        self.finished = False  # Closing bracket of the array seen
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume the next chunk (after the opening bracket) and return completed items."""
+        items: List[str] = []
+        start = 0 if self.parts is not None else None
+        pos = 0
+        if self.escaped:
+            self.escaped = False
+            pos = 1
+        while not self.finished:
+            match = _JSON_STRUCTURE.search(chunk, pos)
+            if match is None:
+                break
+            char, i = match.group(), match.start()
+            pos = i + 1
+            if self.in_string:
+                if char == "\\":
+                    if pos == len(chunk):
+                        self.escaped = True
+                    pos += 1
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 0:
+                        items.append(self._take(chunk, start, pos))
+                        start = None
+                continue
+            if char == '"':
+                self.in_string = True
+                if self.depth == 0:
+                    start = i
+            elif char in "{[":
+                if self.depth == 0:
+                    start = i
+                self.depth += 1
+            elif char in "}]":
+                if self.depth == 0:
+                    # Closing bracket of the array itself
+                    self.finished = True
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        items.append(self._take(chunk, start, pos))
+                        start = None
+        if start is not None:
+            if self.parts is None:
+                self.parts = []
+            self.parts.append(chunk[start:])
+        return items
+
+    def _take(self, chunk: str, start: Optional[int], end: int) -> str:
+        """Return an item's full text, ending at chunk[end], and reset for the next."""
+        if self.parts is None:
+            return chunk[start:end]
+        self.parts.append(chunk[:end])
+        text = "".join(self.parts)
+        self.parts = None
+        return text
+
+
+def _loads(data: Any) -> Any:
+    """Decode JSON with pydantic-core's jiter parser, interning repeated keys.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    return from_json(data, cache_strings="keys", allow_inf_nan=False)
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Get the shared discovery HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _client
+
+
+@dataclass(slots=True)
+class _CachedSource:
+    """Parsed candidates of a discovery source plus its validators."""
+    candidates: List[dict]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float  # time.monotonic() of the last fetch or revalidation
+
 
 class IndexerDiscoveryAgent(Agent):
     """Agent that discovers potential indexers from external sources.
 
     Args:
         prowlarr_service: ProwlarrService instance (optional)
+        max_concurrency: Maximum number of source fetches, and separately of
+            Prowlarr add requests, in flight at once
     """
 
-    def __init__(self, prowlarr_service: Any = None) -> None:
+    def __init__(self, prowlarr_service: Any = None, max_concurrency: int = 8) -> None:
         super().__init__(
             name="IndexerDiscoveryAgent",
             priority=AgentPriority.LOW,
             enabled=settings.discovery_enabled,
         )
         self.prowlarr = prowlarr_service
+        self.max_concurrency = max_concurrency
+        self._source_cache: Dict[str, _CachedSource] = {}
+        # Sources that declared JSON but served a plain text list; later bodies
+        # from them skip the doomed JSON decode and are read line by line
+        self._text_sources: set[str] = set()
         logger.info("Initialized IndexerDiscoveryAgent")
 
     async def run(self) -> AgentResult:
@@ -53,18 +183,38 @@ class IndexerDiscoveryAgent(Agent):
                 message="No discovery sources configured"
             )
 
-        logger.info(f"Running indexer discovery against {len(sources)} sources")
+        logger.info("Running indexer discovery against {} sources", len(sources))
         
         total_discovered = 0
         failed_sources = 0
+        candidates: List[dict] = []
+
+        # Share one pooled client across all sources and fetch them concurrently,
+        # bounded so small source endpoints are not hammered
+        client = await _get_client()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(src: str) -> List[dict]:
+            async with semaphore:
+                return await self._process_source(client, src)
+
+        results = await asyncio.gather(
+            *[_bounded(src) for src in sources],
+            return_exceptions=True,
+        )
 
-        for src in sources:
-            try:
-                discovered = await self._process_source(src)
-                total_discovered += discovered
-            except Exception as e:
-                logger.error(f"Error processing discovery source {src}: {e}")
+        for src, outcome in zip(sources, results, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("Error processing discovery source {}: {}", src, outcome)
                 failed_sources += 1
+            else:
+                total_discovered += len(outcome)
+                candidates.extend(outcome)
+
+        # Add the candidates of all sources as one batch, so an indexer listed
+        # by several sources is only added once
+        if settings.discovery_add_to_prowlarr and self.prowlarr and candidates:
+            await self._add_to_prowlarr(candidates)
 
         message = f"Discovery complete: {total_discovered} indexers found"
         success = failed_sources == 0 if sources else True
@@ -80,56 +230,231 @@ class IndexerDiscoveryAgent(Agent):
             error=f"{failed_sources} sources failed" if failed_sources > 0 else None
         )
 
-    async def _process_source(self, url: str) -> int:
-        """Process a discovery source and return count of discovered indexers."""
-        logger.debug(f"Fetching discovery source: {url}")
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url)
+    async def cleanup(self) -> None:
+        """Close the shared discovery HTTP client."""
+        global _client
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+            logger.debug("Closed discovery HTTP client")
+
+    async def _process_source(self, client: httpx.AsyncClient, url: str) -> List[dict]:
+        """Fetch a discovery source and return its candidate indexers.
+
+        Args:
+            client: Shared HTTP client used to fetch the source
+            url: Discovery source URL
+        """
+        candidates = await self._fetch_candidates(client, url)
+        logger.info("Discovered {} candidate indexers from {}", len(candidates), url)
+        return candidates
+
+    async def _fetch_candidates(self, client: httpx.AsyncClient, url: str) -> List[dict]:
+        """Fetch and parse a discovery source, reusing the cached parse when possible.
+
+        Within ``discovery_cache_ttl_seconds`` of the last fetch the cached
+        candidates are returned without a request. After that the source is
+        revalidated with a conditional GET, and a 304 reuses the cached parse.
+
+        Args:
+            client: Shared HTTP client used to fetch the source
+            url: Discovery source URL
+
+        Returns:
+            List of candidate indexer objects
+        """
+        now = time.monotonic()
+        cached = self._source_cache.get(url)
+        if cached is not None and now - cached.fetched_at < settings.discovery_cache_ttl_seconds:
+            logger.debug("Using cached discovery source: {}", url)
+            return cached.candidates
+
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        logger.debug("Fetching discovery source: {}", url)
+        async with client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and cached is not None:
+                logger.debug("Discovery source not modified: {}", url)
+                cached.fetched_at = now
+                return cached.candidates
+
             resp.raise_for_status()
 
             content_type = resp.headers.get("content-type", "")
-            text = resp.text
-
+            content_length = resp.headers.get("content-length", "")
+            small_body = (
+                content_length.isdigit() and int(content_length) < _STREAM_JSON_THRESHOLD
+            )
             candidates: List[dict] = []
 
-            # Try JSON
-            try:
-                data = resp.json()
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            candidates.append(item)
-                        elif isinstance(item, str):
-                            candidates.append({"baseUrl": item})
-                elif isinstance(data, dict):
-                    # single object may contain list under a key
-                    for v in data.values():
-                        if isinstance(v, list):
-                            for it in v:
-                                if isinstance(it, dict):
-                                    candidates.append(it)
-                # else ignore
-            except (ValueError, json.JSONDecodeError):
-                # fallback: parse as newline-separated text of URLs
-                for line in text.splitlines():
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    candidates.append({"baseUrl": line})
-
-            logger.info(f"Discovered {len(candidates)} candidate indexers from {url}")
-
-            # Optionally add to Prowlarr
-            if settings.discovery_add_to_prowlarr and self.prowlarr:
-                await self._add_to_prowlarr(candidates)
-            
-            return len(candidates)
+            is_json = "json" in content_type and url not in self._text_sources
+
+            if is_json and small_body:
+                body = await resp.aread()
+                try:
+                    candidates = self._parse_json_candidates(_loads(body))
+                except ValueError:
+                    # Server claimed JSON but sent something else; treat as text
+                    self._text_sources.add(url)
+                    candidates = self._parse_text_candidates(resp.text)
+            elif is_json:
+                candidates = await self._stream_json_candidates(resp, url)
+            else:
+                candidates = await self._stream_text_candidates(resp)
+
+            self._source_cache[url] = _CachedSource(
+                candidates=candidates,
+                etag=resp.headers.get("etag"),
+                last_modified=resp.headers.get("last-modified"),
+                fetched_at=now,
+            )
+
+        return candidates
+
+    @staticmethod
+    def _parse_json_candidates(data: Any) -> List[dict]:
+        """Extract candidate indexer objects from a decoded JSON document."""
+        if isinstance(data, list):
+            return [
+                item if isinstance(item, dict) else {"baseUrl": item}
+                for item in data
+                if isinstance(item, (dict, str))
+            ]
+        if isinstance(data, dict):
+            # single object may contain list under a key
+            return [
+                it
+                for v in data.values()
+                if isinstance(v, list)
+                for it in v
+                if isinstance(it, dict)
+            ]
+        # else ignore
+        return []
+
+    @staticmethod
+    def _parse_text_candidates(text: str) -> List[dict]:
+        """Parse a newline-separated list of base URLs, skipping comments."""
+        return [{"baseUrl": line} for line in _TEXT_LINE.findall(text)]
+
+    async def _stream_json_candidates(self, resp: httpx.Response, url: str) -> List[dict]:
+        """Decode a streamed JSON array one item at a time.
+
+        Only the current chunk and any partially received item are held in
+        memory. Bodies that are not a top-level array are buffered and decoded
+        whole, falling back to the text format if they are not JSON at all.
+
+        Raises:
+            ValueError: If the array is malformed or truncated
+        """
+        candidates: List[dict] = []
+        head = ""  # Leading text until the first non-blank character is seen
+        in_array: Optional[bool] = None
+        splitter = _ArraySplitter()
+        # Whole body, kept only when it is not a top-level array
+        buffered: List[str] = []
+
+        async for chunk in resp.aiter_text():
+            if in_array is None:
+                head += chunk
+                stripped = head.lstrip()
+                if not stripped:
+                    continue
+                in_array = stripped[0] == "["
+                chunk = stripped[1:] if in_array else stripped
+            if not in_array:
+                buffered.append(chunk)
+                continue
+            if splitter.finished:
+                continue
+
+            for text in splitter.feed(chunk):
+                item = _loads(text)
+                if isinstance(item, dict):
+                    candidates.append(item)
+                elif isinstance(item, str):
+                    candidates.append({"baseUrl": item})
+
+        if in_array is None:
+            return candidates
+        if in_array:
+            if not splitter.finished:
+                raise ValueError("Truncated or malformed JSON array in discovery response")
+            return candidates
+
+        body = "".join(buffered)
+        try:
+            return self._parse_json_candidates(_loads(body))
+        except ValueError:
+            # Server claimed JSON but sent something else; treat as text
+            self._text_sources.add(url)
+            return self._parse_text_candidates(body)
+
+    async def _stream_text_candidates(self, resp: httpx.Response) -> List[dict]:
+        """Parse a streamed non-JSON body line by line.
+
+        Bodies whose first non-blank line opens a JSON document are buffered
+        and decoded as JSON, to cope with servers that mislabel JSON.
+        """
+        candidates: List[dict] = []
+        buffered: Optional[List[str]] = None
+
+        async for raw_line in resp.aiter_lines():
+            if buffered is not None:
+                buffered.append(raw_line)
+                continue
+            line = raw_line.strip()
+            if not candidates and line[:1] in ("[", "{"):
+                # Untyped or mislabelled JSON body
+                buffered = [raw_line]
+                continue
+            if not line or line.startswith("#"):
+                continue
+            candidates.append({"baseUrl": line})
+
+        if buffered is None:
+            return candidates
+
+        text = "\n".join(buffered)
+        try:
+            return self._parse_json_candidates(_loads(text))
+        except ValueError:
+            return self._parse_text_candidates(text)
 
     async def _add_to_prowlarr(self, candidates: List[dict]) -> None:
+        """Add candidates to Prowlarr, with at most max_concurrency POSTs in flight.
+
+        Prowlarr has no bulk create endpoint, so each candidate is its own POST;
+        duplicates (same baseUrl, or same name when there is no baseUrl) are
+        dropped first so each indexer costs at most one round trip.
+        """
+        # Resolve each candidate's label once; it is both the dedup key and log name
+        seen: set = set()
+        pending: List[tuple] = []
         for c in candidates:
-            try:
-                # Expecting Prowlarr-compatible indexer object; best-effort POST
-                logger.info(f"Adding discovered indexer to Prowlarr: {c.get('baseUrl') or c.get('name')}")
-                await self.prowlarr.client.post("/api/v1/indexer", json=c)
-            except Exception as e:
-                logger.error(f"Failed to add discovered indexer {c}: {e}")
+            label = c.get("baseUrl") or c.get("name")
+            if label is not None:
+                if label in seen:
+                    continue
+                seen.add(label)
+            pending.append((label, c))
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _add_one(label: Any, c: dict) -> None:
+            async with semaphore:
+                try:
+                    # Expecting Prowlarr-compatible indexer object; best-effort POST
+                    logger.info("Adding discovered indexer to Prowlarr: {}", label)
+                    await self.prowlarr.client.post("/api/v1/indexer", json=c)
+                except Exception as e:
+                    logger.error("Failed to add discovered indexer {}: {}", label or c, e)
+
+        await asyncio.gather(
+            *[_add_one(label, c) for label, c in pending], return_exceptions=True
+        )
@@ -4,7 +4,8 @@ Performs periodic health checks against Radarr and Sonarr indexers.
 This agent is read-only and only logs results without making changes.
 """
 
-from typing import Any
+import asyncio
+from typing import Any, Optional
 from loguru import logger
 
 from agents.base import Agent, AgentResult, AgentPriority
@@ -22,12 +23,17 @@ class IndexerHealthAgent(Agent):
     This is a read-only agent suitable for health monitoring dashboards
     and alerting systems. Actual remediation is handled by IndexerAutoHealAgent.
     
+    Radarr and Sonarr are checked concurrently and their indexer tests share
+    one budget of ``max_concurrency`` in-flight requests, so a slow service
+    does not hold back tests against the other.
+    
     Args:
         radarr: RadarrService instance
         sonarr: SonarrService instance
+        max_concurrency: Maximum number of indexer tests in flight across both services
     """
 
-    def __init__(self, radarr: Any, sonarr: Any) -> None:
+    def __init__(self, radarr: Any, sonarr: Any, max_concurrency: int = 8) -> None:
         super().__init__(
             name="IndexerHealthAgent",
             priority=AgentPriority.HIGH,
@@ -35,6 +41,7 @@ class IndexerHealthAgent(Agent):
         )
         self.radarr = radarr
         self.sonarr = sonarr
+        self.max_concurrency = max_concurrency
         logger.info("Initialized IndexerHealthAgent")
 
     async def run(self) -> AgentResult:
@@ -45,14 +52,21 @@ class IndexerHealthAgent(Agent):
         """
         logger.info("Starting health check cycle")
         
-        radarr_success = await self._check_service("Radarr", self.radarr)
-        sonarr_success = await self._check_service("Sonarr", self.sonarr)
+        # Radarr and Sonarr are independent, so check them concurrently under
+        # a single shared budget of in-flight indexer tests
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outcomes = await asyncio.gather(
+            self._check_service(semaphore, "Radarr", self.radarr),
+            self._check_service(semaphore, "Sonarr", self.sonarr),
+            return_exceptions=True,
+        )
+        radarr_success, sonarr_success = (outcome is True for outcome in outcomes)
         
         success = radarr_success and sonarr_success
         message = "Health check cycle completed"
         
         if success:
-            logger.info(f"{message} successfully")
+            logger.info("{} successfully", message)
             return AgentResult(
                 success=True,
                 message=f"{message} successfully",
@@ -68,7 +82,7 @@ class IndexerHealthAgent(Agent):
             if not sonarr_success:
                 error_details.append("Sonarr check failed")
             
-            logger.warning(f"{message} with failures")
+            logger.warning("{} with failures", message)
             return AgentResult(
                 success=False,
                 message=f"{message} with failures",
@@ -79,10 +93,16 @@ class IndexerHealthAgent(Agent):
                 }
             )
 
-    async def _check_service(self, service_name: str, service: Any) -> bool:
+    async def _check_service(
+        self,
+        semaphore: asyncio.Semaphore,
+        service_name: str,
+        service: Any,
+    ) -> bool:
         """Check health of all indexers in a service.
         
         Args:
+            semaphore: Semaphore bounding concurrent indexer tests
             service_name: Display name of the service (e.g., "Radarr")
             service: Service instance with get_indexers() and test_indexer() methods
             
@@ -90,29 +110,36 @@ class IndexerHealthAgent(Agent):
             True if all indexers were checked (regardless of result),
             False if the service itself failed to respond
         """
-        logger.info(f"Checking {service_name} indexers")
+        logger.info("Checking {} indexers", service_name)
         
         try:
             indexers = await service.get_indexers()
         except Exception as e:
-            logger.error(f"Failed to fetch {service_name} indexers: {e}")
+            logger.error("Failed to fetch {} indexers: {}", service_name, e)
             return False
 
-        logger.debug(f"Testing {len(indexers)} {service_name} indexers")
-        success_count = 0
-        fail_count = 0
-        
-        for idx in indexers:
+        logger.debug("Testing {} {} indexers", len(indexers), service_name)
+
+        async def _test_one(idx: dict) -> Optional[str]:
+            """Test one indexer, returning None on success or the error text."""
             indexer_id = idx.get("id")
             indexer_name = idx.get("name", f"unknown (id={indexer_id})")
             
-            try:
-                await service.test_indexer(indexer_id)
-                logger.info(f"{service_name} indexer '{indexer_name}' OK")
-                success_count += 1
-            except Exception as e:
-                logger.warning(f"{service_name} indexer '{indexer_name}' FAILED: {str(e)[:100]}")
-                fail_count += 1
+            async with semaphore:
+                try:
+                    await service.test_indexer(indexer_id)
+                except Exception as e:
+                    error = str(e)[:100]
+                    logger.warning("{} indexer {!r} FAILED: {}", service_name, indexer_name, error)
+                    return error
+            logger.debug("{} indexer {!r} OK", service_name, indexer_name)
+            return None
+
+        errors = await asyncio.gather(*[_test_one(idx) for idx in indexers])
+        fail_count = sum(1 for error in errors if error is not None)
+        success_count = len(errors) - fail_count
 
-        logger.info(f"{service_name} health check: {success_count} passed, {fail_count} failed")
+        logger.info(
+            "{} health check: {} passed, {} failed", service_name, success_count, fail_count
+        )
         return True
@@ -4,9 +4,11 @@ Provides comprehensive monitoring, state tracking, and event logging
 for agent operations with detailed metrics and observability.
 """
 
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from enum import Enum
 from loguru import logger
 
@@ -30,20 +32,26 @@ class EventType(str, Enum):
     ERROR_ENCOUNTERED = "error_encountered"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a monitored event."""
     event_type: EventType
     agent_name: Optional[str]
     message: str
-    timestamp: datetime = field(default_factory=utc_now)
+    # Epoch nanoseconds; cheaper to capture than a datetime on every event
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a timezone-aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
     def __repr__(self) -> str:
         return f"[{self.timestamp.isoformat()}] {self.event_type.value} - {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentHealthStatus:
     """Health status of an agent."""
     agent_name: str
@@ -52,17 +60,38 @@ class AgentHealthStatus:
     last_error: Optional[str] = None
     consecutive_failures: int = 0
     uptime_percentage: float = 100.0
+    # Serialized form keyed on the field values it was built from
+    _cached_dict: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "agent_name": self.agent_name,
-            "is_healthy": self.is_healthy,
-            "last_run": self.last_run.isoformat() if self.last_run else None,
-            "last_error": self.last_error,
-            "consecutive_failures": self.consecutive_failures,
-            "uptime_percentage": f"{self.uptime_percentage:.1f}%",
-        }
+        """Convert to dictionary.
+
+        The dictionary is only rebuilt when a field has changed since the last
+        call, so callers must treat it as read-only.
+        """
+        key = (
+            self.agent_name,
+            self.is_healthy,
+            self.last_run,
+            self.last_error,
+            self.consecutive_failures,
+            self.uptime_percentage,
+        )
+        if self._cached_dict is None or self._cached_dict[0] != key:
+            self._cached_dict = (
+                key,
+                {
+                    "agent_name": self.agent_name,
+                    "is_healthy": self.is_healthy,
+                    "last_run": self.last_run.isoformat() if self.last_run else None,
+                    "last_error": self.last_error,
+                    "consecutive_failures": self.consecutive_failures,
+                    "uptime_percentage": f"{self.uptime_percentage:.1f}%",
+                },
+            )
+        return self._cached_dict[1]
 
 
 class AgentMonitor:
@@ -82,8 +111,16 @@ class AgentMonitor:
             max_event_history: Maximum number of events to keep in memory
         """
         self.max_event_history = max_event_history
-        self.events: List[Event] = []
+        # Bounded ring buffer: appending past maxlen drops the oldest event in O(1)
+        self.events: Deque[Event] = deque(maxlen=max_event_history)
+        # Secondary indexes of (sequence number, event) so filtered queries only
+        # walk matching events; entries older than the main buffer are stale
+        self._recorded = 0
+        self._by_agent: Dict[str, Deque[Tuple[int, Event]]] = {}
+        self._by_type: Dict[EventType, Deque[Tuple[int, Event]]] = {}
         self.agent_health: Dict[str, AgentHealthStatus] = {}
+        # Insertion-ordered set of unhealthy agent names, updated on transitions
+        self._unhealthy: Dict[str, None] = {}
         self.error_threshold = 3  # Max consecutive failures before alerting
         logger.info(f"Initialized AgentMonitor (max_events={max_event_history})")
 
@@ -110,11 +147,29 @@ class AgentMonitor:
         )
         self.events.append(event)
 
-        # Maintain size limit
-        if len(self.events) > self.max_event_history:
-            self.events = self.events[-self.max_event_history :]
+        seq = self._recorded
+        self._recorded += 1
+        if agent_name is not None:
+            self._index_event(self._by_agent, agent_name, seq, event)
+        self._index_event(self._by_type, event_type, seq, event)
+
+        logger.debug("Event recorded: {}", event)
 
-        logger.debug(f"Event recorded: {event}")
+    def _index_event(
+        self,
+        index: Dict[Any, Deque[Tuple[int, Event]]],
+        key: Any,
+        seq: int,
+        event: Event,
+    ) -> None:
+        """Append an event to a secondary index, pruning entries already evicted."""
+        entries = index.get(key)
+        if entries is None:
+            entries = index[key] = deque(maxlen=self.max_event_history)
+        oldest_live = self._recorded - self.max_event_history
+        while entries and entries[0][0] < oldest_live:
+            entries.popleft()
+        entries.append((seq, event))
 
     def update_agent_health(
         self,
@@ -138,6 +193,7 @@ class AgentMonitor:
         if success:
             status.consecutive_failures = 0
             status.is_healthy = True
+            self._unhealthy.pop(agent_name, None)
             status.last_error = None
         else:
             status.consecutive_failures += 1
@@ -145,6 +201,7 @@ class AgentMonitor:
             
             if status.consecutive_failures >= self.error_threshold:
                 status.is_healthy = False
+                self._unhealthy[agent_name] = None
                 logger.warning(
                     f"Agent '{agent_name}' marked unhealthy after "
                     f"{status.consecutive_failures} consecutive failures"
@@ -181,9 +238,7 @@ class AgentMonitor:
         Returns:
             List of unhealthy agent names
         """
-        return [
-            name for name, status in self.agent_health.items() if not status.is_healthy
-        ]
+        return list(self._unhealthy)
 
     def get_events(
         self,
@@ -201,9 +256,27 @@ class AgentMonitor:
         Returns:
             List of matching events (most recent first)
         """
+        if not agent_name and not event_type:
+            results = []
+            for event in reversed(self.events):
+                results.append(event)
+                if len(results) >= limit:
+                    break
+            return results
+
+        # Walk the narrower index and filter on the other criterion
+        by_agent = self._by_agent.get(agent_name, ()) if agent_name else None
+        by_type = self._by_type.get(event_type, ()) if event_type else None
+        if by_agent is not None and by_type is not None:
+            entries = min(by_agent, by_type, key=len)
+        else:
+            entries = by_agent if by_agent is not None else by_type
+        oldest_live = self._recorded - self.max_event_history
         results = []
 
-        for event in reversed(self.events):
+        for seq, event in reversed(entries):
+            if seq < oldest_live:
+                break
             if agent_name and event.agent_name != agent_name:
                 continue
             if event_type and event.event_type != event_type:
@@ -221,7 +294,7 @@ class AgentMonitor:
             Dictionary with overall health and metrics
         """
         total_agents = len(self.agent_health)
-        unhealthy = len(self.get_unhealthy_agents())
+        unhealthy = len(self._unhealthy)
         healthy = total_agents - unhealthy
 
         recent_events = self.get_events(limit=10)
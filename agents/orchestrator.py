@@ -4,10 +4,13 @@ The orchestrator manages agent lifecycle, scheduling, monitoring, and
 coordination across multiple autonomous agents working toward common goals.
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Callable, Dict, Optional, List, Any, Tuple
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 import asyncio
+import heapq
+import time
+import uuid
 from loguru import logger
 
 from agents.base import Agent, AgentResult, AgentState
@@ -18,7 +21,7 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSchedule:
     """Schedule configuration for periodic agent execution."""
     agent_name: str
@@ -27,28 +30,64 @@ class AgentSchedule:
     last_executed: Optional[datetime] = None
     next_execution: Optional[datetime] = None
     max_concurrent_runs: int = 1
+    # time.monotonic() deadline of the next run; the scheduler only compares
+    # this, while the datetimes above are kept for status output
+    next_execution_mono: float = field(
+        default_factory=time.monotonic, repr=False, compare=False
+    )
+    # ISO strings of (last_executed, next_execution), keyed on the datetimes
+    _iso: Optional[Tuple[Tuple[Any, Any], Optional[str], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def should_execute(self) -> bool:
-        """Check if agent should execute based on schedule."""
-        if not self.enabled:
-            return False
+    def iso_timestamps(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get last_executed and next_execution as ISO strings.
+
+        The strings are only re-rendered when either timestamp changes.
+
+        Returns:
+            Tuple of (last_executed, next_execution), None where unset
+        """
+        key = (self.last_executed, self.next_execution)
+        if self._iso is None or self._iso[0] != key:
+            self._iso = (
+                key,
+                self.last_executed.isoformat() if self.last_executed else None,
+                self.next_execution.isoformat() if self.next_execution else None,
+            )
+        return self._iso[1], self._iso[2]
 
-        if self.next_execution is None:
-            return True
+    def should_execute(self, now: Optional[float] = None) -> bool:
+        """Check if agent should execute based on schedule.
 
-        return utc_now() >= self.next_execution
+        Args:
+            now: Current time.monotonic(), so callers checking many schedules
+                can share one reading (default: time.monotonic())
+        """
+        if now is None:
+            now = time.monotonic()
+        return self.enabled and now >= self.next_execution_mono
 
-    def update_next_execution(self) -> None:
-        """Update next execution time after a run."""
-        self.last_executed = utc_now()
+    def update_next_execution(self, now: Optional[datetime] = None) -> None:
+        """Update next execution time after a run.
+
+        Args:
+            now: Time the run finished (default: utc_now())
+        """
+        self.last_executed = now or utc_now()
         self.next_execution = self.last_executed + timedelta(
             seconds=self.interval_seconds
         )
+        self.next_execution_mono = time.monotonic() + self.interval_seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorMetrics:
-    """Metrics for orchestrator performance."""
+    """Metrics for orchestrator performance.
+
+    Counters are only mutated from the event loop thread, between awaits, so
+    plain increments are safe without any lock.
+    """
     total_cycles: int = 0
     successful_cycles: int = 0
     failed_cycles: int = 0
@@ -57,11 +96,15 @@ class OrchestratorMetrics:
     total_agent_failures: int = 0
     cycle_duration_seconds: float = 0.0
     started_at: datetime = field(default_factory=utc_now)
+    # Monotonic start time, so uptime is cheap to read and immune to clock jumps
+    _started_monotonic: float = field(
+        default_factory=time.monotonic, init=False, repr=False, compare=False
+    )
 
     @property
     def uptime_seconds(self) -> float:
         """Calculate orchestrator uptime."""
-        return (utc_now() - self.started_at).total_seconds()
+        return time.monotonic() - self._started_monotonic
 
     @property
     def cycle_success_rate(self) -> float:
@@ -89,20 +132,35 @@ class AgentOrchestrator:
     - Event logging and observability
     """
 
-    def __init__(self, name: str = "DefaultOrchestrator") -> None:
+    def __init__(
+        self, name: str = "DefaultOrchestrator", status_cache_ttl: float = 2.0
+    ) -> None:
         """Initialize orchestrator.
 
         Args:
             name: Name identifier for this orchestrator instance
+            status_cache_ttl: Seconds get_status() reuses its last result for
+                (0 disables caching)
         """
         self.name = name
+        self.status_cache_ttl = status_cache_ttl
+        # (time.monotonic() when built, status dict); cleared on state changes
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self.agents: Dict[str, Agent] = {}
         self.schedules: Dict[str, AgentSchedule] = {}
+        # Min-heap of (next_execution_mono, agent_name); entries whose deadline
+        # no longer matches the schedule are stale and skipped when popped
+        self._due_heap: List[Tuple[float, str]] = []
         self.metrics = OrchestratorMetrics()
         self._running = False
-        self._execution_lock = asyncio.Lock()
+        # Per-agent in-flight run counts; the event loop is single-threaded and
+        # nothing awaits between checking and updating a count, so no lock is needed
         self._active_runs: Dict[str, int] = {}
-        logger.info(f"Initialized orchestrator: {name}")
+        # Background runs by task ID, oldest first; finished ones are pruned
+        # beyond max_background_tasks
+        self._background_tasks: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self.max_background_tasks = 100
+        logger.info("Initialized orchestrator: {}", name)
 
     def register_agent(
         self, agent: Agent, interval_seconds: Optional[int] = None
@@ -121,6 +179,7 @@ class AgentOrchestrator:
 
         self.agents[agent.name] = agent
         self._active_runs[agent.name] = 0
+        self._status_cache = None
 
         if interval_seconds is not None:
             schedule = AgentSchedule(
@@ -129,11 +188,12 @@ class AgentOrchestrator:
                 next_execution=utc_now(),
             )
             self.schedules[agent.name] = schedule
+            self._push_schedule(schedule)
             logger.info(
-                f"Scheduled agent '{agent.name}' with interval {interval_seconds}s"
+                "Scheduled agent '{}' with interval {}s", agent.name, interval_seconds
             )
         else:
-            logger.debug(f"Registered agent '{agent.name}' (on-demand only)")
+            logger.debug("Registered agent '{}' (on-demand only)", agent.name)
 
     def unregister_agent(self, agent_name: str) -> bool:
         """Unregister an agent from the orchestrator.
@@ -150,7 +210,8 @@ class AgentOrchestrator:
         del self.agents[agent_name]
         self.schedules.pop(agent_name, None)
         self._active_runs.pop(agent_name, None)
-        logger.info(f"Unregistered agent: {agent_name}")
+        self._status_cache = None
+        logger.info("Unregistered agent: {}", agent_name)
         return True
 
     def enable_agent(self, agent_name: str) -> bool:
@@ -166,9 +227,11 @@ class AgentOrchestrator:
             return False
 
         self.agents[agent_name].enabled = True
+        self._status_cache = None
         if agent_name in self.schedules:
             self.schedules[agent_name].enabled = True
-        logger.info(f"Enabled agent: {agent_name}")
+            self._push_schedule(self.schedules[agent_name])
+        logger.info("Enabled agent: {}", agent_name)
         return True
 
     def disable_agent(self, agent_name: str) -> bool:
@@ -184,9 +247,10 @@ class AgentOrchestrator:
             return False
 
         self.agents[agent_name].enabled = False
+        self._status_cache = None
         if agent_name in self.schedules:
             self.schedules[agent_name].enabled = False
-        logger.info(f"Disabled agent: {agent_name}")
+        logger.info("Disabled agent: {}", agent_name)
         return True
 
     async def execute_agent(self, agent_name: str) -> Optional[AgentResult]:
@@ -199,24 +263,27 @@ class AgentOrchestrator:
             AgentResult if successful, None if agent not found or already running
         """
         if agent_name not in self.agents:
-            logger.error(f"Agent '{agent_name}' not found")
+            logger.error("Agent '{}' not found", agent_name)
             return None
 
         agent = self.agents[agent_name]
         schedule = self.schedules.get(agent_name)
 
         # Check concurrency limit
-        if schedule and self._active_runs[agent_name] >= schedule.max_concurrent_runs:
+        active = self._active_runs[agent_name]
+        if schedule and active >= schedule.max_concurrent_runs:
             logger.warning(
-                f"Agent '{agent_name}' already at max concurrent runs ({schedule.max_concurrent_runs})"
+                "Agent '{}' already at max concurrent runs ({})",
+                agent_name,
+                schedule.max_concurrent_runs,
             )
             return None
 
-        async with self._execution_lock:
-            self._active_runs[agent_name] += 1
+        self._active_runs[agent_name] = active + 1
+        self._status_cache = None
 
         try:
-            logger.debug(f"Starting execution of agent: {agent_name}")
+            logger.debug("Starting execution of agent: {}", agent_name)
             agent.state = AgentState.RUNNING
             result = await agent.run()
 
@@ -230,56 +297,180 @@ class AgentOrchestrator:
             return result
 
         except Exception as e:
-            logger.exception(f"Error executing agent {agent_name}: {e}")
+            logger.exception("Error executing agent {}: {}", agent_name, e)
             self.metrics.total_agent_failures += 1
             return None
 
         finally:
-            async with self._execution_lock:
-                self._active_runs[agent_name] = max(0, self._active_runs[agent_name] - 1)
+            # The agent may have been unregistered while it was running
+            if agent_name in self._active_runs:
+                self._active_runs[agent_name] -= 1
+            self._status_cache = None
 
             # Update schedule
             if schedule:
                 schedule.update_next_execution()
+                self._push_schedule(schedule)
+
+    def _push_schedule(self, schedule: AgentSchedule) -> None:
+        """Queue a schedule's next execution deadline on the due heap."""
+        heapq.heappush(self._due_heap, (schedule.next_execution_mono, schedule.agent_name))
+
+    def _pop_due(self, now: float) -> List[str]:
+        """Pop the names of all enabled agents whose schedules are due.
+
+        Args:
+            now: Current time.monotonic()
+
+        Returns:
+            Due agent names, earliest deadline first
+        """
+        due: List[str] = []
+        while self._due_heap and self._due_heap[0][0] <= now:
+            deadline, agent_name = heapq.heappop(self._due_heap)
+            schedule = self.schedules.get(agent_name)
+            if schedule is None or agent_name in due:
+                continue
+            if schedule.next_execution_mono != deadline:
+                # Rescheduled since this entry was queued; requeue its current time
+                self._push_schedule(schedule)
+                continue
+            # Disabled schedules are requeued by enable_agent
+            if schedule.should_execute(now):
+                due.append(agent_name)
+        return due
+
+    def start_background(
+        self,
+        agent_name: str,
+        on_complete: Optional[Callable[[AgentResult], None]] = None,
+    ) -> Optional[str]:
+        """Start an on-demand agent run without waiting for it to finish.
+
+        Args:
+            agent_name: Name of the agent to execute
+            on_complete: Called with the AgentResult if the run completes
+
+        Returns:
+            Task ID to poll with get_task_result(), or None if agent not found
+        """
+        if agent_name not in self.agents:
+            logger.error("Agent '{}' not found", agent_name)
+            return None
+
+        task_id = uuid.uuid4().hex
+        task = asyncio.create_task(
+            self.execute_agent(agent_name), name=f"agent-run-{agent_name}-{task_id}"
+        )
+        if on_complete is not None:
+            def _done(t: asyncio.Task) -> None:
+                if t.cancelled() or t.exception() is not None:
+                    return
+                if t.result() is not None:
+                    on_complete(t.result())
+
+            task.add_done_callback(_done)
+        self._background_tasks[task_id] = (agent_name, task)
+
+        # Forget the oldest finished runs once over the retention limit
+        excess = len(self._background_tasks) - self.max_background_tasks
+        if excess > 0:
+            finished = [tid for tid, (_, t) in self._background_tasks.items() if t.done()]
+            for old_id in finished[:excess]:
+                del self._background_tasks[old_id]
+
+        return task_id
+
+    def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a background run started with start_background().
+
+        Args:
+            task_id: Task ID returned by start_background()
+
+        Returns:
+            Dictionary with the ``agent`` name, ``status`` ("running",
+            "completed", "rejected", "cancelled" or "error") and, once
+            completed, the ``result``; errored runs also carry the ``error``.
+            None if the task ID is unknown
+        """
+        entry = self._background_tasks.get(task_id)
+        if entry is None:
+            return None
+        agent_name, task = entry
+        if not task.done():
+            return {"agent": agent_name, "status": "running", "result": None}
+
+        if task.cancelled():
+            return {"agent": agent_name, "status": "cancelled", "result": None}
+        exc = task.exception()
+        if exc is not None:
+            return {"agent": agent_name, "status": "error", "result": None, "error": str(exc)}
+
+        result = task.result()
+        if result is None:
+            # Not run: already at max concurrent runs, or failed inside execute_agent
+            return {"agent": agent_name, "status": "rejected", "result": None}
+        return {"agent": agent_name, "status": "completed", "result": result}
 
     async def execute_scheduled_agents(self) -> List[AgentResult]:
         """Execute all agents whose schedules are due.
 
+        Due agents are popped from a heap ordered by next execution time, so
+        each tick only touches schedules that are actually due. They run
+        concurrently, so a slow agent does not delay the others scheduled for
+        the same tick.
+
         Returns:
             List of AgentResult objects from executed agents
         """
-        results = []
-
-        for agent_name, schedule in self.schedules.items():
-            if schedule.should_execute():
-                logger.debug(f"Schedule check: executing {agent_name}")
-                result = await self.execute_agent(agent_name)
-                if result:
-                    results.append(result)
+        due = self._pop_due(time.monotonic())
+        if not due:
+            return []
+
+        logger.opt(lazy=True).debug("Schedule check: executing {}", lambda: ", ".join(due))
+        outcomes = await asyncio.gather(
+            *[self.execute_agent(agent_name) for agent_name in due],
+            return_exceptions=True,
+        )
 
+        results = []
+        for agent_name, outcome in zip(due, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("Scheduled run of agent {} failed: {}", agent_name, outcome)
+            elif outcome:
+                results.append(outcome)
+
+        # Runs rejected at max_concurrent_runs are not requeued: their past
+        # deadline would be due again at once and spin the loop. The run
+        # already in flight requeues the schedule when it finishes.
         return results
 
     async def start(self, check_interval: float = 60.0) -> None:
         """Start the orchestrator's main event loop.
 
-        Continuously monitors schedules and executes agents as needed.
+        Continuously monitors schedules and executes agents as needed. Between
+        checks it sleeps until the earliest scheduled deadline, but never longer
+        than ``check_interval``.
 
         Args:
-            check_interval: Seconds between schedule checks (default: 60)
+            check_interval: Maximum seconds between schedule checks (default: 60)
         """
         if self._running:
             logger.warning("Orchestrator already running")
             return
 
         self._running = True
-        logger.info(f"Starting orchestrator: {self.name}")
+        self._status_cache = None
+        logger.info("Starting orchestrator: {}", self.name)
 
         try:
             while self._running:
                 try:
+                    cycle_start = time.monotonic()
                     results = await self.execute_scheduled_agents()
 
                     if results:
+                        self.metrics.cycle_duration_seconds = time.monotonic() - cycle_start
                         self.metrics.total_cycles += 1
                         success_count = sum(
                             1 for r in results if r.success
@@ -288,11 +479,12 @@ class AgentOrchestrator:
                             self.metrics.successful_cycles += 1
                         else:
                             self.metrics.failed_cycles += 1
+                        self._status_cache = None
 
-                    await asyncio.sleep(check_interval)
+                    await asyncio.sleep(self._next_sleep(check_interval))
 
                 except Exception as e:
-                    logger.exception(f"Error in orchestrator cycle: {e}")
+                    logger.exception("Error in orchestrator cycle: {}", e)
                     self.metrics.failed_cycles += 1
                     self.metrics.total_cycles += 1
                     await asyncio.sleep(check_interval)
@@ -302,44 +494,79 @@ class AgentOrchestrator:
         finally:
             await self.stop()
 
+    def _next_sleep(self, check_interval: float) -> float:
+        """Seconds to sleep until the next schedule check.
+
+        Args:
+            check_interval: Upper bound on the sleep
+
+        Returns:
+            Time until the earliest queued deadline, clamped to
+            [0.05, check_interval]
+        """
+        if not self._due_heap:
+            return check_interval
+        until_due = self._due_heap[0][0] - time.monotonic()
+        return max(0.05, min(check_interval, until_due))
+
     async def stop(self) -> None:
         """Stop the orchestrator and cleanup all agents."""
-        logger.info(f"Stopping orchestrator: {self.name}")
+        logger.info("Stopping orchestrator: {}", self.name)
         self._running = False
+        self._status_cache = None
+
+        # Cancel background runs that are still in flight
+        pending = [task for _, task in self._background_tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Cleanup all agents concurrently, so shutdown takes as long as the
+        # slowest cleanup rather than the sum of them
+        agents = list(self.agents.values())
+        outcomes = await asyncio.gather(
+            *[agent.cleanup() for agent in agents], return_exceptions=True
+        )
+        for agent, outcome in zip(agents, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error("Error cleaning up agent {}: {}", agent.name, outcome)
 
-        # Cleanup all agents
-        for agent in self.agents.values():
-            try:
-                await agent.cleanup()
-            except Exception as e:
-                logger.error(f"Error cleaning up agent {agent.name}: {e}")
+        logger.info("Orchestrator stopped: {}", self.name)
 
-        logger.info(f"Orchestrator stopped: {self.name}")
+    def _schedule_status(self, name: str, schedule: AgentSchedule) -> Dict[str, Any]:
+        """Build the status entry for one schedule."""
+        last_executed, next_execution = schedule.iso_timestamps()
+        return {
+            "interval_seconds": schedule.interval_seconds,
+            "enabled": schedule.enabled,
+            "last_executed": last_executed,
+            "next_execution": next_execution,
+            "active_runs": self._active_runs.get(name, 0),
+        }
 
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive orchestrator status.
 
+        The result is reused for ``status_cache_ttl`` seconds and rebuilt early
+        whenever agents are registered, toggled, started or finished, so bursts
+        of status polling do not rebuild it per request. Treat it as read-only.
+
         Returns:
             Dictionary containing status, metrics, and agent information
         """
-        return {
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < self.status_cache_ttl:
+            return self._status_cache[1]
+
+        status = {
             "name": self.name,
             "running": self._running,
             "agents": {
                 name: agent.get_status() for name, agent in self.agents.items()
             },
             "schedules": {
-                name: {
-                    "interval_seconds": schedule.interval_seconds,
-                    "enabled": schedule.enabled,
-                    "last_executed": schedule.last_executed.isoformat()
-                    if schedule.last_executed
-                    else None,
-                    "next_execution": schedule.next_execution.isoformat()
-                    if schedule.next_execution
-                    else None,
-                    "active_runs": self._active_runs.get(name, 0),
-                }
+                name: self._schedule_status(name, schedule)
                 for name, schedule in self.schedules.items()
             },
             "metrics": {
@@ -354,3 +581,5 @@ class AgentOrchestrator:
                 "uptime_seconds": self.metrics.uptime_seconds,
             },
         }
+        self._status_cache = (now, status)
+        return status
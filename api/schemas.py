@@ -4,19 +4,24 @@ Defines request and response models for all API endpoints.
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
+class _ResponseModel(BaseModel):
+    """Base for response models, which are built once and never mutated."""
+    model_config = ConfigDict(frozen=True)
+
+
 # Request/Response Models
 
-class HealthResponse(BaseModel):
+class HealthResponse(_ResponseModel):
     """Health check response."""
     status: str = Field(description="Service status")
     service: str = Field(description="Service name")
 
 
-class ServiceInfoResponse(BaseModel):
+class ServiceInfoResponse(_ResponseModel):
     """Service information response."""
     service: str
     version: str
@@ -24,21 +29,21 @@ class ServiceInfoResponse(BaseModel):
     endpoints: Dict[str, Dict[str, str]]
 
 
-class IndexerInfo(BaseModel):
+class IndexerInfo(_ResponseModel):
     """Details about a single indexer."""
     id: int
     name: str
     enable: bool = True
 
 
-class ServiceIndexersResponse(BaseModel):
+class ServiceIndexersResponse(_ResponseModel):
     """Response with list of indexers from a service."""
     service: str
     count: int
     indexers: List[Dict[str, Any]]
 
 
-class TestIndexerResponse(BaseModel):
+class TestIndexerResponse(_ResponseModel):
     """Response from testing an indexer."""
     success: bool
     service: str
@@ -46,7 +51,7 @@ class TestIndexerResponse(BaseModel):
     error: Optional[str] = None
 
 
-class IndexerActionResponse(BaseModel):
+class IndexerActionResponse(_ResponseModel):
     """Response from enable/disable operations."""
     success: bool
     service: str
@@ -54,29 +59,36 @@ class IndexerActionResponse(BaseModel):
     action: str
 
 
-class IndexerStatsItem(BaseModel):
+class IndexerSummary(_ResponseModel):
+    """Condensed indexer entry used in statistics."""
+    id: Optional[int] = None
+    name: Optional[str] = None
+    enabled: bool = True
+
+
+class IndexerStatsItem(_ResponseModel):
     """Statistics for a single service's indexers."""
     total: int
     enabled: int
     disabled: int
-    indexers: List[Dict[str, Any]] = []
+    indexers: List[IndexerSummary] = []
 
 
-class IndexerStatsResponse(BaseModel):
+class IndexerStatsResponse(_ResponseModel):
     """Overall indexer statistics."""
     timestamp: Optional[str] = None
     total: int
     by_service: Dict[str, IndexerStatsItem]
 
 
-class AgentRunResponse(BaseModel):
+class AgentRunResponse(_ResponseModel):
     """Response from running an agent."""
     success: bool
     agent: str
     message: str
 
 
-class HealthRecord(BaseModel):
+class HealthRecord(_ResponseModel):
     """A single health check record."""
     id: int
     indexer_id: int
@@ -86,7 +98,7 @@ class HealthRecord(BaseModel):
     timestamp: str
 
 
-class HealthHistoryResponse(BaseModel):
+class HealthHistoryResponse(_ResponseModel):
     """Health history response."""
     hours: int
     records_returned: int
@@ -94,7 +106,7 @@ class HealthHistoryResponse(BaseModel):
     history: Dict[str, List[HealthRecord]]
 
 
-class ServiceHealthStats(BaseModel):
+class ServiceHealthStats(_ResponseModel):
     """Health statistics for a service."""
     total_indexers: int
     enabled: int
@@ -103,14 +115,14 @@ class ServiceHealthStats(BaseModel):
     recent_failures: List[Dict[str, Any]]
 
 
-class DetailedStatsResponse(BaseModel):
+class DetailedStatsResponse(_ResponseModel):
     """Detailed statistics response."""
     generated_at: str
     total_records: int
     by_service: Dict[str, Any]
 
 
-class JobInfo(BaseModel):
+class JobInfo(_ResponseModel):
     """Information about a scheduled job."""
     id: str
     name: str
@@ -118,13 +130,13 @@ class JobInfo(BaseModel):
     trigger: str
 
 
-class AgentStatusResponse(BaseModel):
+class AgentStatusResponse(_ResponseModel):
     """Status of all agents and scheduler."""
     scheduler: Dict[str, Any]
     agents: Dict[str, str]
 
 
-class AgentMetrics(BaseModel):
+class AgentMetrics(_ResponseModel):
     """Agent execution metrics."""
     total_runs: int
     successful_runs: int
@@ -135,7 +147,7 @@ class AgentMetrics(BaseModel):
     last_error: Optional[str] = None
 
 
-class OrchestratorStatusResponse(BaseModel):
+class OrchestratorStatusResponse(_ResponseModel):
     """Orchestrator status response."""
     name: str
     running: bool
@@ -144,7 +156,7 @@ class OrchestratorStatusResponse(BaseModel):
     metrics: Dict[str, Any]
 
 
-class AgentHealthStatus(BaseModel):
+class AgentHealthStatus(_ResponseModel):
     """Health status of an agent."""
     agent_name: str
     is_healthy: bool
@@ -154,18 +166,26 @@ class AgentHealthStatus(BaseModel):
     uptime_percentage: str
 
 
-class MonitorStatusResponse(BaseModel):
+class EventRecord(_ResponseModel):
+    """A single monitored event as reported in status summaries."""
+    type: str
+    agent: Optional[str] = None
+    message: str
+    timestamp: str
+
+
+class MonitorStatusResponse(_ResponseModel):
     """Monitor status response."""
     total_agents: int
     healthy_agents: int
     unhealthy_agents: int
     health_percentage: float
     total_events_logged: int
-    recent_events: List[Dict[str, Any]]
-    agent_health: Dict[str, Dict[str, Any]]
+    recent_events: List[EventRecord]
+    agent_health: Dict[str, AgentHealthStatus]
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ResponseModel):
     """Standard error response."""
     detail: str
     status_code: int
@@ -7,13 +7,20 @@ The Settings class performs strict validation and will raise errors on
 missing required fields or invalid configuration.
 """
 
+from functools import lru_cache
 from typing import Optional, List
-from pydantic import Field, HttpUrl, field_validator
+from pydantic import Field, HttpUrl, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 
+_API_KEY_FIELDS = ("radarr_api_key", "sonarr_api_key", "prowlarr_api_key")
+_URL_FIELDS = ("radarr_url", "sonarr_url", "prowlarr_url", "database_url")
+# API key values left over from .env.example
+_PLACEHOLDER_PREFIX = "your_"
+_PLACEHOLDER_KEYS = frozenset({"change_me"})
+
 
 class Settings(BaseSettings):
     """Core application settings loaded from environment or .env file.
@@ -56,11 +63,27 @@ class Settings(BaseSettings):
         description="Prowlarr API key (from Settings -> General -> Security -> API Key)"
     )
 
+    arr_max_concurrency: int = Field(
+        default=8,
+        description="Maximum concurrent requests to each of Radarr and Sonarr, shared by all agents"
+    )
+
     # Database configuration (OPTIONAL - defaults to SQLite)
     database_url: str = Field(
         default=f"sqlite+aiosqlite:///{BASE_DIR}/db/app.db",
         description="SQLAlchemy database URL (supports SQLite, PostgreSQL, MySQL, etc.)"
     )
+    # Bounds are enforced on load, since the engine is built from these at import
+    db_pool_size: int = Field(
+        default=20,
+        gt=0,
+        description="Connection pool size for PostgreSQL/MySQL (ignored for SQLite)"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Connections allowed beyond db_pool_size under load (ignored for SQLite)"
+    )
 
     # Indexer discovery configuration
     discovery_enabled: bool = Field(
@@ -83,6 +106,21 @@ class Settings(BaseSettings):
         description="If true, discovered indexers will be automatically added to Prowlarr via its API"
     )
 
+    discovery_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of concurrent discovery fetches and Prowlarr adds"
+    )
+
+    discovery_cache_ttl_seconds: int = Field(
+        default=1800,
+        description="Seconds a discovery source response is reused before revalidating it"
+    )
+
+    status_cache_ttl_seconds: float = Field(
+        default=2.0,
+        description="Seconds the orchestrator status is reused between polls (0 disables caching)"
+    )
+
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
         env_file_encoding="utf-8",
@@ -90,21 +128,27 @@ class Settings(BaseSettings):
         extra="ignore",  # Ignore extra environment variables not in the model
     )
 
-    @field_validator("radarr_api_key", "sonarr_api_key", "prowlarr_api_key")
-    @classmethod
-    def api_key_must_not_be_empty(cls, v: str) -> str:
-        """Validate that API keys are not empty placeholder strings."""
-        if not v or v.startswith("your_") or v == "change_me":
-            raise ValueError("API key appears to be a placeholder. Please set actual value.")
-        return v
+    @model_validator(mode="after")
+    def _normalize(self) -> "Settings":
+        """Reject placeholder API keys and strip trailing slashes from URLs.
 
-    @field_validator("radarr_url", "sonarr_url", "prowlarr_url", "database_url")
-    @classmethod
-    def validate_urls(cls, v: str) -> str:
-        """Ensure URLs are well-formed and accessible."""
-        if not v:
-            raise ValueError("URL cannot be empty")
-        return v.rstrip("/")  # Remove trailing slash for consistency
+        All fields are checked in one pass rather than through a validator
+        call per field.
+        """
+        for attr in _API_KEY_FIELDS:
+            v = getattr(self, attr)
+            if not v or v.startswith(_PLACEHOLDER_PREFIX) or v in _PLACEHOLDER_KEYS:
+                raise ValueError(
+                    f"{attr} appears to be a placeholder. Please set actual value."
+                )
+        for attr in _URL_FIELDS:
+            v = getattr(self, attr)
+            if not v:
+                raise ValueError(f"{attr} cannot be empty")
+            if v.endswith("/"):
+                # Remove trailing slash for consistency
+                setattr(self, attr, v.rstrip("/"))
+        return self
 
     def validate_at_startup(self) -> None:
         """Perform runtime validation of configuration.
@@ -132,13 +176,24 @@ class Settings(BaseSettings):
         # Validate scheduler interval
         if self.discovery_interval_hours < 1:
             raise ValueError("discovery_interval_hours must be >= 1")
-        
-        # Validate that database path is writable (for SQLite)
-        if self.database_url.startswith("sqlite+aiosqlite://"):
-            db_path = self.database_url.replace("sqlite+aiosqlite:///", "")
-            db_dir = Path(db_path).parent
-            if not db_dir.exists():
-                db_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.arr_max_concurrency < 1:
+            raise ValueError("arr_max_concurrency must be >= 1")
+
+        if self.discovery_max_concurrency < 1:
+            raise ValueError("discovery_max_concurrency must be >= 1")
+
+        if self.discovery_cache_ttl_seconds < 0:
+            raise ValueError("discovery_cache_ttl_seconds must be >= 0")
+
+        if self.status_cache_ttl_seconds < 0:
+            raise ValueError("status_cache_ttl_seconds must be >= 0")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings instance, reading .env only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -4,9 +4,11 @@ Caches indexer health results to reduce unnecessary API calls
 while maintaining freshness guarantees.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List, Any
+from time import monotonic
+from typing import Optional, Dict, Iterable, Any, Set, Tuple
 from loguru import logger
 
 # Get current UTC time in a timezone-aware manner
@@ -15,7 +17,7 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Single cached health check result."""
     service: str
@@ -23,16 +25,22 @@ class CacheEntry:
     indexer_name: str
     success: bool
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=utc_now)
+    # time.monotonic() when cached, so freshness checks are a float subtraction
+    timestamp: float = field(default_factory=monotonic)
     
     @property
     def age_seconds(self) -> float:
         """How old is this cache entry (in seconds)."""
-        return (utc_now() - self.timestamp).total_seconds()
+        return monotonic() - self.timestamp
+    
+    @property
+    def cached_at(self) -> datetime:
+        """Approximate wall-clock time the entry was cached, for display."""
+        return utc_now() - timedelta(seconds=self.age_seconds)
     
     def is_fresh(self, ttl_seconds: int = 300) -> bool:
         """Check if this entry is still fresh (not expired)."""
-        return self.age_seconds < ttl_seconds
+        return monotonic() - self.timestamp < ttl_seconds
 
 
 class HealthCheckCache:
@@ -51,14 +59,26 @@ class HealthCheckCache:
         """
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
-        self._cache: Dict[str, CacheEntry] = {}
+        # Keyed on (service, indexer_id), least recently used first; hits and
+        # writes move a key to the end
+        self._cache: OrderedDict[Tuple[str, int], CacheEntry] = OrderedDict()
+        # Keys cached per service, so invalidate_service skips other services
+        self._by_service: Dict[str, Set[Tuple[str, int]]] = {}
         self._hit_count = 0
         self._miss_count = 0
-        logger.info(f"Initialized HealthCheckCache (ttl={ttl_seconds}s, max={max_entries})")
+        # Rounded hit rate keyed on the (hits, misses) it was computed from
+        self._hit_rate: Optional[Tuple[Tuple[int, int], float]] = None
+        logger.info(
+            "Initialized HealthCheckCache (ttl={}s, max={})", ttl_seconds, max_entries
+        )
     
-    def _make_key(self, service: str, indexer_id: int) -> str:
-        """Create cache key from service and indexer."""
-        return f"{service}:{indexer_id}"
+    def _forget(self, key: Tuple[str, int]) -> None:
+        """Drop a key that was just removed from _cache from the service index."""
+        keys = self._by_service.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_service[key[0]]
     
     def get(self, service: str, indexer_id: int) -> Optional[CacheEntry]:
         """Get cached health check result if fresh.
@@ -70,7 +90,7 @@ class HealthCheckCache:
         Returns:
             CacheEntry if found and fresh, None otherwise
         """
-        key = self._make_key(service, indexer_id)
+        key = (service, indexer_id)
         entry = self._cache.get(key)
         
         if entry is None:
@@ -80,13 +100,86 @@ class HealthCheckCache:
         if not entry.is_fresh(self.ttl_seconds):
             # Expired, remove it
             del self._cache[key]
+            self._forget(key)
             self._miss_count += 1
             return None
         
+        self._cache.move_to_end(key)
         self._hit_count += 1
-        logger.debug(f"Cache HIT for {service} indexer {indexer_id}")
+        logger.debug("Cache HIT for {} indexer {}", service, indexer_id)
         return entry
     
+    def get_many(
+        self, keys: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Optional[CacheEntry]]:
+        """Get cached health check results for several indexers at once.
+        
+        Equivalent to calling get() for each key, but reads the clock once
+        for the whole batch.
+        
+        Args:
+            keys: (service, indexer_id) pairs
+            
+        Returns:
+            Dictionary mapping each key to its fresh CacheEntry, or None
+        """
+        now = monotonic()
+        ttl = self.ttl_seconds
+        cache = self._cache
+        results: Dict[Tuple[str, int], Optional[CacheEntry]] = {}
+        hits = misses = 0
+        
+        for key in keys:
+            entry = cache.get(key)
+            if entry is not None and now - entry.timestamp < ttl:
+                cache.move_to_end(key)
+                results[key] = entry
+                hits += 1
+                continue
+            if entry is not None:
+                # Expired, remove it
+                del cache[key]
+                self._forget(key)
+            results[key] = None
+            misses += 1
+        
+        self._hit_count += hits
+        self._miss_count += misses
+        logger.debug("Cache batch lookup: {} hits, {} misses", hits, misses)
+        return results
+    
+    def set_many(
+        self, results: Iterable[Tuple[str, int, str, bool, Optional[str]]]
+    ) -> None:
+        """Store several health check results, stamped with one timestamp.
+        
+        Args:
+            results: (service, indexer_id, indexer_name, success, error) tuples
+        """
+        now = monotonic()
+        cache = self._cache
+        count = 0
+        
+        for service, indexer_id, indexer_name, success, error in results:
+            key = (service, indexer_id)
+            if key not in cache:
+                while cache and len(cache) >= self.max_entries:
+                    oldest_key, _ = cache.popitem(last=False)
+                    self._forget(oldest_key)
+            cache[key] = CacheEntry(
+                service=service,
+                indexer_id=indexer_id,
+                indexer_name=indexer_name,
+                success=success,
+                error=error,
+                timestamp=now,
+            )
+            cache.move_to_end(key)
+            self._by_service.setdefault(service, set()).add(key)
+            count += 1
+        
+        logger.debug("Cached {} results", count)
+    
     def set(self, service: str, indexer_id: int, indexer_name: str, 
             success: bool, error: Optional[str] = None) -> None:
         """Store health check result in cache.
@@ -98,26 +191,26 @@ class HealthCheckCache:
             success: Whether the health check passed
             error: Error message if check failed
         """
-        # Evict oldest entry if at capacity
-        if len(self._cache) >= self.max_entries:
-            # Find and remove oldest entry (simple LRU)
-            oldest_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].timestamp
-            )
-            del self._cache[oldest_key]
-            logger.debug(f"Evicted cache entry {oldest_key} (capacity reached)")
+        key = (service, indexer_id)
+        
+        # Evict least recently used entries if a new key would exceed capacity
+        if key not in self._cache:
+            while self._cache and len(self._cache) >= self.max_entries:
+                oldest_key, _ = self._cache.popitem(last=False)
+                self._forget(oldest_key)
+                logger.debug("Evicted cache entry {} (capacity reached)", oldest_key)
         
-        key = self._make_key(service, indexer_id)
         self._cache[key] = CacheEntry(
             service=service,
             indexer_id=indexer_id,
             indexer_name=indexer_name,
             success=success,
             error=error,
-            timestamp=utc_now()
+            timestamp=monotonic()
         )
-        logger.debug(f"Cached result for {service} indexer {indexer_id}")
+        self._cache.move_to_end(key)
+        self._by_service.setdefault(service, set()).add(key)
+        logger.debug("Cached result for {} indexer {}", service, indexer_id)
     
     def invalidate(self, service: str, indexer_id: int) -> None:
         """Manually invalidate a cache entry.
@@ -126,10 +219,11 @@ class HealthCheckCache:
             service: Service name
             indexer_id: Indexer ID
         """
-        key = self._make_key(service, indexer_id)
+        key = (service, indexer_id)
         if key in self._cache:
             del self._cache[key]
-            logger.debug(f"Invalidated cache for {service} indexer {indexer_id}")
+            self._forget(key)
+            logger.debug("Invalidated cache for {} indexer {}", service, indexer_id)
     
     def invalidate_service(self, service: str) -> None:
         """Invalidate all entries for a service.
@@ -137,14 +231,17 @@ class HealthCheckCache:
         Args:
             service: Service name (e.g., 'radarr')
         """
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{service}:")]
+        keys_to_remove = self._by_service.pop(service, set())
         for key in keys_to_remove:
             del self._cache[key]
-        logger.debug(f"Invalidated {len(keys_to_remove)} cache entries for {service}")
+        logger.debug(
+            "Invalidated {} cache entries for {}", len(keys_to_remove), service
+        )
     
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._by_service.clear()
         logger.info("Cleared health check cache")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -154,14 +251,17 @@ class HealthCheckCache:
             Dictionary with hit rate, miss rate, size, etc.
         """
         total = self._hit_count + self._miss_count
-        hit_rate = (self._hit_count / total * 100) if total > 0 else 0
+        key = (self._hit_count, self._miss_count)
+        if self._hit_rate is None or self._hit_rate[0] != key:
+            hit_rate = (self._hit_count / total * 100) if total > 0 else 0
+            self._hit_rate = (key, round(hit_rate, 2))
         
         return {
             "size": len(self._cache),
             "hits": self._hit_count,
             "misses": self._miss_count,
             "total_accesses": total,
-            "hit_rate_percent": round(hit_rate, 2),
+            "hit_rate_percent": self._hit_rate[1],
             "ttl_seconds": self.ttl_seconds,
             "max_entries": self.max_entries,
         }
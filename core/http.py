@@ -1,6 +1,45 @@
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple
+import asyncio
 import httpx
 from loguru import logger
+from pydantic_core import from_json
+
+# Seconds an idle pooled connection is kept open; long enough to span the
+# bursts of requests an agent run makes against one service
+_KEEPALIVE_EXPIRY = 60.0
+
+
+def create_http_client(
+    timeout: float = 30, max_connections: Optional[int] = None, **kwargs: Any
+) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient with the connection pool used for Arr services.
+
+    A single client can be shared by several ArrHttpClient instances so that
+    services behind the same host or reverse proxy reuse each other's
+    connections.
+
+    Args:
+        timeout: Request timeout in seconds (default: 30)
+        max_connections: Connection pool size, all kept alive between requests
+            (default: 64, of which 32 are kept alive)
+        **kwargs: Passed through to httpx.AsyncClient
+
+    Returns:
+        A new httpx.AsyncClient; the caller is responsible for closing it
+    """
+    if max_connections is not None:
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+    else:
+        limits = httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, **kwargs)
 
 
 class ArrHttpClient:
@@ -8,24 +47,58 @@ class ArrHttpClient:
 
     Provides convenience helpers for REST API calls and a proper async context manager.
     Includes automatic API key injection, error handling, and response parsing.
+    Identical GETs issued while one is already in flight share its response.
     
     Args:
         base_url: Base URL of the Arr service (e.g., http://radarr:7878)
         api_key: API key for authentication
         timeout: Request timeout in seconds (default: 30)
+        max_connections: Connection pool size, all kept alive between requests
+            so concurrent bursts reuse sockets (default: 64, of which 32 are
+            kept alive)
+        max_in_flight: Maximum concurrent requests to the service across all
+            callers sharing this client; extra requests wait their turn
+            (default: unbounded)
+        client: Shared httpx.AsyncClient to send requests through, e.g. from
+            create_http_client(); it is not closed by close(). When omitted
+            the wrapper creates and owns its own client, and timeout and
+            max_connections configure it
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        max_connections: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.base_url = base_url
-        self.client = httpx.AsyncClient(
+        # Requests carry an absolute URL and the API key themselves, so they
+        # work the same over a shared client as over an owned one
+        self._url_prefix = base_url.rstrip("/")
+        self._auth_headers = {"X-Api-Key": api_key}
+        # Shared by every agent using this service, so concurrent agents
+        # together never exceed the bound
+        self._in_flight: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+        )
+        # In-flight GETs keyed on (path, params), joined by identical requests
+        self._pending_gets: Dict[
+            Tuple[str, Optional[FrozenSet[Tuple[str, Any]]]], asyncio.Task
+        ] = {}
+        self._owns_client = client is None
+        self.client = client if client is not None else create_http_client(
+            timeout,
+            max_connections,
             base_url=base_url,
-            headers={"X-Api-Key": api_key},
-            timeout=timeout,
+            headers=self._auth_headers,
         )
-        logger.debug(f"Initialized HTTP client for {base_url}")
+        logger.debug("Initialized HTTP client for {}", base_url)
 
     async def _parse_response(self, resp: httpx.Response) -> Any:
-        """Parse HTTP response, attempting JSON first, then falling back to text.
+        """Parse HTTP response as JSON when it is labelled as such, otherwise as text.
         
         Args:
             resp: The httpx.Response object
@@ -40,19 +113,94 @@ class ArrHttpClient:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"HTTP error {e.response.status_code}: {e.response.text[:200]}"
+                "HTTP error {}: {}", e.response.status_code, e.response.text[:200]
             )
             raise
         
+        # Only attempt a JSON parse when the server says the body is JSON
+        if "json" not in resp.headers.get("content-type", ""):
+            return resp.text
+
         try:
-            return resp.json()
+            # Decode the raw bytes with jiter, interning the keys repeated
+            # across the objects of list responses
+            return from_json(resp.content, cache_strings="keys")
         except ValueError:
             # Not JSON, return as text
             return resp.text
 
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, waiting for an in-flight slot if the client is bounded.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            **kwargs: Passed through to httpx.AsyncClient.request
+
+        Returns:
+            The raw httpx.Response
+        """
+        url = self._url_prefix + path
+        if self._in_flight is None:
+            return await self.client.request(
+                method, url, headers=self._auth_headers, **kwargs
+            )
+        async with self._in_flight:
+            return await self.client.request(
+                method, url, headers=self._auth_headers, **kwargs
+            )
+
+    async def _single_flight(
+        self, key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run fetch() unless a request with the same key is already in flight.
+
+        Concurrent callers with the same key await one shared task and get the
+        same result (or exception). A caller being cancelled does not cancel
+        the shared request for the others.
+
+        Args:
+            key: Identity of the request
+            fetch: Starts the request when there is none to join
+
+        Returns:
+            Result of the shared request
+        """
+        task = self._pending_gets.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending_gets[key] = task
+            task.add_done_callback(lambda t: self._forget_get(key, t))
+        return await asyncio.shield(task)
+
+    def _forget_get(self, key: Tuple[Any, ...], task: asyncio.Future) -> None:
+        """Drop a finished shared GET and mark its exception as retrieved.
+
+        The exception is fetched here because every waiter may already have
+        been cancelled, in which case nobody else would retrieve it.
+
+        Args:
+            key: Identity of the request
+            task: The finished shared request
+        """
+        if self._pending_gets.get(key) is task:
+            del self._pending_gets[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _get(self, path: str, params: Optional[dict]) -> Any:
+        """Send a GET request and parse its response."""
+        logger.debug("GET {}", path)
+        resp = await self._send("GET", path, params=params)
+        return await self._parse_response(resp)
+
     async def get(self, path: str, params: Optional[dict] = None) -> Any:
         """Perform GET request.
         
+        Identical requests already in flight are joined rather than repeated,
+        so concurrent callers receive the same parsed object and must not
+        mutate it.
+        
         Args:
             path: API endpoint path (e.g., /api/v3/indexer)
             params: Optional query parameters
@@ -60,9 +208,29 @@ class ArrHttpClient:
         Returns:
             Parsed response (JSON or text)
         """
-        logger.debug(f"GET {path}")
-        resp = await self.client.get(path, params=params)
-        return await self._parse_response(resp)
+        key = self._get_key(path, params)
+        if key is None:
+            # List-valued params cannot key the in-flight map; send as is
+            return await self._get(path, params)
+        return await self._single_flight(key, lambda: self._get(path, params))
+
+    @staticmethod
+    def _get_key(
+        path: str, params: Optional[dict]
+    ) -> Optional[Tuple[str, Optional[FrozenSet[Tuple[str, Any]]]]]:
+        """Build the in-flight key of a GET, or None if its params are unhashable.
+
+        Args:
+            path: API endpoint path
+            params: Optional query parameters
+
+        Returns:
+            Hashable (path, params) key, or None for e.g. list-valued params
+        """
+        try:
+            return (path, frozenset(params.items()) if params else None)
+        except TypeError:
+            return None
 
     async def post(self, path: str, json: Optional[dict] = None) -> Any:
         """Perform POST request.
@@ -74,8 +242,8 @@ class ArrHttpClient:
         Returns:
             Parsed response
         """
-        logger.debug(f"POST {path}")
-        resp = await self.client.post(path, json=json)
+        logger.debug("POST {}", path)
+        resp = await self._send("POST", path, json=json)
         return await self._parse_response(resp)
 
     async def put(self, path: str, json: Optional[dict] = None) -> Any:
@@ -88,8 +256,8 @@ class ArrHttpClient:
         Returns:
             Parsed response
         """
-        logger.debug(f"PUT {path}")
-        resp = await self.client.put(path, json=json)
+        logger.debug("PUT {}", path)
+        resp = await self._send("PUT", path, json=json)
         return await self._parse_response(resp)
 
     async def delete(self, path: str) -> Any:
@@ -101,12 +269,32 @@ class ArrHttpClient:
         Returns:
             Parsed response
         """
-        logger.debug(f"DELETE {path}")
-        resp = await self.client.delete(path)
+        logger.debug("DELETE {}", path)
+        resp = await self._send("DELETE", path)
         return await self._parse_response(resp)
 
+    async def warm_up(self, timeout: float = 5.0) -> None:
+        """Open a pooled connection ahead of the first real request.
+        
+        Sends a HEAD to the unauthenticated /ping endpoint so the TCP (and
+        TLS) handshake is done before agents need the service. Failures are
+        only logged; the first real request simply connects as usual.
+        
+        Args:
+            timeout: Seconds to allow for the warm-up request
+        """
+        try:
+            await self.client.head(
+                self._url_prefix + "/ping", headers=self._auth_headers, timeout=timeout
+            )
+            logger.debug("Warmed up connection to {}", self.base_url)
+        except Exception as e:
+            logger.debug("Connection warm-up for {} failed: {}", self.base_url, e)
+
     async def close(self) -> None:
-        """Close the underlying HTTP client connection."""
+        """Close the underlying HTTP client connection, unless it is shared."""
+        if not self._owns_client:
+            return
         await self.client.aclose()
         logger.debug("HTTP client closed")
 
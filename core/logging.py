@@ -19,13 +19,16 @@ LOG_FORMAT = (
     "<level>{message}</level>"
 )
 
-# Add console output with color support
-logger.add(
-    sys.stdout,
-    level="INFO",
-    format=LOG_FORMAT,
-    colorize=True,
-)
+# Colour only when attached to a terminal; redirected output (containers,
+# log collectors) skips the ANSI markup. Records are queued to a background
+# worker, so a slow stdout pipe never blocks the event loop.
+_CONSOLE_SINK = {
+    "format": LOG_FORMAT,
+    "colorize": sys.stdout.isatty(),
+    "enqueue": True,
+}
+
+logger.add(sys.stdout, level="INFO", **_CONSOLE_SINK)
 
 
 def configure_debug_logging(enabled: bool = False) -> None:
@@ -36,12 +39,7 @@ def configure_debug_logging(enabled: bool = False) -> None:
     """
     if enabled:
         logger.remove()
-        logger.add(
-            sys.stdout,
-            level="DEBUG",
-            format=LOG_FORMAT,
-            colorize=True,
-        )
+        logger.add(sys.stdout, level="DEBUG", **_CONSOLE_SINK)
 
 
 def add_file_logging(file_path: str, level: str = "INFO") -> None:
@@ -58,4 +56,6 @@ def add_file_logging(file_path: str, level: str = "INFO") -> None:
         colorize=False,
         rotation="500 MB",  # Rotate when file reaches 500MB
         retention="7 days",  # Keep logs for 7 days
+        compression="gz",  # Compress rotated files
+        enqueue=True,  # Write, rotate and compress on a background worker
     )
@@ -1,12 +1,15 @@
 """Monitoring and observability utilities."""
 
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
-import json
+from functools import lru_cache
+import os
+import time
 from pathlib import Path
 
 from loguru import logger
+from pydantic_core import from_json, to_json
 
 # Get current UTC time in a timezone-aware manner
 def utc_now() -> datetime:
@@ -14,6 +17,43 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Bytes read per step when scanning the event file backwards
+_TAIL_BLOCK_SIZE = 8192
+
+
+def _tail_lines(path: Path, n: int) -> List[bytes]:
+    """Read the last n lines of a file without reading the rest of it.
+
+    Blocks are read backwards from the end until they hold n complete lines,
+    so the cost depends on n rather than on the file size.
+
+    Args:
+        path: File to read
+        n: Number of lines wanted
+
+    Returns:
+        Up to n last lines, oldest first, without line endings
+    """
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks: List[bytes] = []
+        newlines = 0
+        # n + 1 newlines guarantee n whole lines even with a trailing newline
+        while pos > 0 and newlines <= n:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    lines = b"".join(reversed(blocks)).splitlines()
+    if pos > 0:
+        lines = lines[1:]  # First line may start mid-line
+    return lines[-n:]
+
+
 @dataclass
 class HealthMetrics:
     """Health metrics snapshot."""
@@ -29,8 +69,11 @@ class HealthMetrics:
 class MetricsCollector:
     """Collects and manages application metrics."""
     
+    __slots__ = ("start_time", "_start_monotonic", "error_count", "success_count")
+    
     def __init__(self) -> None:
-        self.start_time = utc_now()
+        self.start_time = utc_now()  # Wall-clock start, for display
+        self._start_monotonic = time.monotonic()
         self.error_count = 0
         self.success_count = 0
     
@@ -44,7 +87,7 @@ class MetricsCollector:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics snapshot."""
-        uptime = (utc_now() - self.start_time).total_seconds()
+        uptime = time.monotonic() - self._start_monotonic
         total = self.error_count + self.success_count
         success_rate = (
             (self.success_count / total * 100) if total > 0 else 0
@@ -60,12 +103,23 @@ class MetricsCollector:
 
 
 class EventLog:
-    """Structured event logging for audit trail."""
+    """Structured event logging for audit trail.
+    
+    Events are serialized from a reused payload dict, so log_event must be
+    called from one thread (the event loop), not concurrently from workers.
+    """
     
     def __init__(self, log_dir: Optional[Path] = None) -> None:
         self.log_dir = log_dir or Path("logs")
         self.log_dir.mkdir(exist_ok=True)
         self.event_file = self.log_dir / "events.jsonl"
+        # Append handle kept open across events; unbuffered, so each event is
+        # a single append write and is on disk as soon as log_event returns
+        self._fh: Optional[BinaryIO] = None
+        # Payload overwritten for each event; to_json copies it into bytes
+        self._event: Dict[str, Any] = dict.fromkeys(
+            ("timestamp", "event_type", "service", "severity", "details")
+        )
     
     def log_event(
         self,
@@ -82,19 +136,27 @@ class EventLog:
             details: Event details as dictionary
             severity: Event severity (INFO, WARNING, ERROR)
         """
-        event = {
-            "timestamp": utc_now().isoformat(),
-            "event_type": event_type,
-            "service": service,
-            "severity": severity,
-            "details": details,
-        }
+        event = self._event
+        event["timestamp"] = utc_now().isoformat()
+        event["event_type"] = event_type
+        event["service"] = service
+        event["severity"] = severity
+        event["details"] = details
         
         try:
-            with open(self.event_file, "a") as f:
-                f.write(json.dumps(event) + "\n")
+            if self._fh is None or self._fh.closed:
+                self._fh = open(self.event_file, "ab", buffering=0)
+            self._fh.write(to_json(event) + b"\n")
         except Exception as e:
             logger.error(f"Failed to write event log: {e}")
+        finally:
+            event["details"] = None  # Don't keep the caller's details alive
+    
+    def close(self) -> None:
+        """Close the event file handle; the next event reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
     
     def get_recent_events(self, limit: int = 100) -> list:
         """Get recent events from log file.
@@ -111,15 +173,11 @@ class EventLog:
             return events
         
         try:
-            with open(self.event_file, "r") as f:
-                lines = f.readlines()
-                # Get last N lines
-                for line in lines[-limit:]:
-                    try:
-                        event = json.loads(line.strip())
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        pass
+            for line in _tail_lines(self.event_file, limit):
+                try:
+                    events.append(from_json(line))
+                except ValueError:
+                    pass
         except Exception as e:
             logger.error(f"Failed to read event log: {e}")
         
@@ -129,9 +187,18 @@ class EventLog:
 class StartupStatus:
     """Tracks application startup status and completion."""
     
+    __slots__ = (
+        "startup_complete",
+        "startup_time",
+        "_startup_monotonic",
+        "startup_errors",
+        "agents_run",
+    )
+    
     def __init__(self) -> None:
         self.startup_complete = False
         self.startup_time: Optional[datetime] = None
+        self._startup_monotonic: Optional[float] = None
         self.startup_errors: list = []
         self.agents_run: Dict[str, bool] = {
             "health_check": False,
@@ -142,6 +209,7 @@ class StartupStatus:
     def mark_startup_start(self) -> None:
         """Mark startup as starting."""
         self.startup_time = utc_now()
+        self._startup_monotonic = time.monotonic()
         self.startup_complete = False
     
     def mark_agent_run(self, agent_name: str) -> None:
@@ -172,8 +240,8 @@ class StartupStatus:
         if self.startup_time:
             status["startup_time"] = self.startup_time.isoformat()
             status["startup_duration_seconds"] = (
-                utc_now() - self.startup_time
-            ).total_seconds()
+                time.monotonic() - self._startup_monotonic
+            )
         
         if self.startup_errors:
             status["errors"] = self.startup_errors
@@ -181,7 +249,13 @@ class StartupStatus:
         return status
 
 
-# Global instances
+@lru_cache(maxsize=1)
+def get_event_log() -> EventLog:
+    """Get the process-wide EventLog, creating the log directory on first use."""
+    return EventLog()
+
+
+# Global instances; the event log is created lazily by get_event_log() so
+# importing this module does no filesystem I/O
 metrics_collector = MetricsCollector()
-event_log = EventLog()
 startup_status = StartupStatus()
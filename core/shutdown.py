@@ -6,7 +6,7 @@ cleanup and connection draining.
 
 import asyncio
 import signal
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 from loguru import logger
 
 
@@ -20,6 +20,8 @@ class ShutdownHandler:
     - Logs shutdown events
     """
     
+    __slots__ = ("timeout_seconds", "shutdown_event", "handlers", "is_shutting_down")
+    
     def __init__(self, timeout_seconds: int = 30) -> None:
         """Initialize shutdown handler.
         
@@ -28,7 +30,8 @@ class ShutdownHandler:
         """
         self.timeout_seconds = timeout_seconds
         self.shutdown_event = asyncio.Event()
-        self.handlers: List[Callable] = []
+        # (handler, is coroutine function), checked once at registration
+        self.handlers: List[Tuple[Callable, bool]] = []
         self.is_shutting_down = False
         logger.info(f"Initialized ShutdownHandler (timeout={timeout_seconds}s)")
     
@@ -40,7 +43,7 @@ class ShutdownHandler:
         Args:
             handler: Async callable that performs cleanup
         """
-        self.handlers.append(handler)
+        self.handlers.append((handler, asyncio.iscoroutinefunction(handler)))
         logger.debug(f"Registered shutdown handler: {handler.__name__}")
     
     async def handle_shutdown(self) -> None:
@@ -57,10 +60,10 @@ class ShutdownHandler:
         logger.info("Initiating graceful shutdown...")
         
         # Call handlers in reverse order
-        for handler in reversed(self.handlers):
+        for handler, is_coroutine in reversed(self.handlers):
             try:
                 logger.info(f"Running shutdown handler: {handler.__name__}")
-                if asyncio.iscoroutinefunction(handler):
+                if is_coroutine:
                     await asyncio.wait_for(
                         handler(),
                         timeout=self.timeout_seconds
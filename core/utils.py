@@ -2,7 +2,8 @@
 
 import asyncio
 from typing import Callable, TypeVar, Any, Optional
-from functools import wraps
+from functools import cache, wraps
+from time import monotonic
 from loguru import logger
 
 T = TypeVar("T")
@@ -20,11 +21,27 @@ def retry(
         max_attempts: Maximum number of attempts
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier for each retry
-        exceptions: Tuple of exceptions to catch and retry on
+        exceptions: Exception class, or tuple/list of classes, to catch and retry on
         
     Returns:
         Decorated async function that retries on failure
     """
+    # Normalise to a tuple so the memo key is hashable; a bare exception class
+    # is accepted as well, as ``except`` allows
+    if not isinstance(exceptions, tuple):
+        exceptions = (exceptions,) if isinstance(exceptions, type) else tuple(exceptions)
+    return _retry_decorator(max_attempts, delay, backoff, exceptions)
+
+
+@cache
+def _retry_decorator(
+    max_attempts: int, delay: float, backoff: float, exceptions: tuple
+) -> Callable:
+    """Build the retry decorator for one configuration.
+
+    Memoized, so every ``@retry(...)`` with the same arguments applies the
+    same decorator object instead of building a new closure.
+    """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -62,6 +79,15 @@ class CircuitBreaker:
     hammering failing services.
     """
     
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "recovery_timeout",
+        "failure_count",
+        "last_failure_time",
+        "is_open",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -72,7 +98,7 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
         self.is_open = False
     
     def record_success(self) -> None:
@@ -83,12 +109,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed call."""
         self.failure_count += 1
-        try:
-            self.last_failure_time = asyncio.get_running_loop().time()
-        except RuntimeError:
-            # No event loop running, use time.time()
-            import time
-            self.last_failure_time = time.time()
+        self.last_failure_time = monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.is_open = True
@@ -100,15 +121,8 @@ class CircuitBreaker:
             return True
         
         # Try to recover after timeout
-        if self.last_failure_time:
-            try:
-                current_time = asyncio.get_running_loop().time()
-            except RuntimeError:
-                # No event loop, use time.time()
-                import time
-                current_time = time.time()
-            
-            elapsed = current_time - self.last_failure_time
+        if self.last_failure_time is not None:
+            elapsed = monotonic() - self.last_failure_time
             if elapsed >= self.recovery_timeout:
                 logger.info(f"Circuit breaker '{self.name}' attempting recovery")
                 self.is_open = False
@@ -4,11 +4,45 @@ Provides comprehensive validation of application configuration
 before startup to catch issues early.
 """
 
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+import asyncio
+import time
 import httpx
 from loguru import logger
+from sqlalchemy import text
 from config.settings import settings
 
+# Seconds a validation result is reused while the settings it checked are unchanged
+_VALIDATION_TTL_SECONDS = 30.0
+
+# (display name, settings URL attribute, settings API key attribute, authenticated
+# status path) per Arr service
+_SERVICE_PROBES: Tuple[Tuple[str, str, str, str], ...] = (
+    ("Radarr", "radarr_url", "radarr_api_key", "/api/v3/system/status"),
+    ("Sonarr", "sonarr_url", "sonarr_api_key", "/api/v3/system/status"),
+    ("Prowlarr", "prowlarr_url", "prowlarr_api_key", "/api/v1/system/status"),
+)
+
+# (time.monotonic() when validated, settings key, (success, errors, warnings))
+_last_validation: Optional[
+    Tuple[float, Tuple[Any, ...], Tuple[bool, List[str], List[str]]]
+] = None
+
+
+def _settings_key() -> Tuple[Any, ...]:
+    """Get the settings that validation depends on, as a comparable key."""
+    return (
+        settings.radarr_url,
+        settings.radarr_api_key,
+        settings.sonarr_url,
+        settings.sonarr_api_key,
+        settings.prowlarr_url,
+        settings.prowlarr_api_key,
+        settings.database_url,
+        settings.discovery_enabled,
+        tuple(settings.discovery_sources),
+    )
+
 
 class ConfigurationValidator:
     """Validates application configuration at startup.
@@ -24,20 +58,55 @@ class ConfigurationValidator:
     def __init__(self) -> None:
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # One pooled client for every probe; close it with aclose()
+        self._http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client shared by the probes."""
+        await self._http.aclose()
     
-    async def validate_all(self) -> Tuple[bool, List[str], List[str]]:
+    async def validate_all(self, force: bool = False) -> Tuple[bool, List[str], List[str]]:
         """Run all validation checks.
         
+        A result from the last ``_VALIDATION_TTL_SECONDS`` is reused without
+        probing anything, as long as the validated settings have not changed.
+        
+        Args:
+            force: Re-run the checks even if a recent result is cached
+        
         Returns:
             Tuple of (success, errors, warnings)
         """
+        global _last_validation
+        key = _settings_key()
+        if not force and _last_validation is not None:
+            validated_at, cached_key, (success, errors, warnings) = _last_validation
+            age = time.monotonic() - validated_at
+            if cached_key == key and age < _VALIDATION_TTL_SECONDS:
+                logger.debug("Reusing configuration validation from {:.1f}s ago", age)
+                self.errors, self.warnings = list(errors), list(warnings)
+                return success, self.errors, self.warnings
+        
         logger.info("Starting configuration validation")
         
-        await self._validate_arr_services()
-        await self._validate_database()
-        await self._validate_discovery_config()
+        # The checks touch independent resources, so run them concurrently
+        await asyncio.gather(
+            self._validate_arr_services(),
+            self._validate_database(),
+            self._validate_discovery_config(),
+        )
+        
+        success = not self.errors
+        _last_validation = (
+            time.monotonic(),
+            key,
+            (success, list(self.errors), list(self.warnings)),
+        )
         
-        if self.errors:
+        if not success:
             logger.error(f"Configuration validation failed with {len(self.errors)} error(s)")
             return False, self.errors, self.warnings
         
@@ -49,40 +118,85 @@ class ConfigurationValidator:
         return True, self.errors, self.warnings
     
     async def _validate_arr_services(self) -> None:
-        """Validate Arr service URLs and accessibility."""
-        services = [
-            ("Radarr", settings.radarr_url, settings.radarr_api_key),
-            ("Sonarr", settings.sonarr_url, settings.sonarr_api_key),
-            ("Prowlarr", settings.prowlarr_url, settings.prowlarr_api_key),
-        ]
-        
-        for name, url, api_key in services:
-            if not url:
-                self.errors.append(f"{name} URL is not configured")
-                continue
+        """Validate Arr service URLs and accessibility.
+        
+        The services are probed concurrently, so validation takes as long as
+        the slowest probe rather than the sum of them.
+        """
+        results = await asyncio.gather(
+            *[
+                self._probe_service(
+                    name, getattr(settings, url_attr), getattr(settings, key_attr), path
+                )
+                for name, url_attr, key_attr, path in _SERVICE_PROBES
+            ],
+            return_exceptions=True,
+        )
+        
+        for (name, _, _, _), result in zip(_SERVICE_PROBES, results, strict=True):
+            if isinstance(result, BaseException):
+                self.errors.append(f"{name} validation failed: {str(result)}")
+            else:
+                self.errors.extend(result)
+    
+    async def _status_of(
+        self, method: str, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> int:
+        """Send a request and return its status code without reading the body.
+        
+        Only the status line and headers are received; the response is closed
+        before any body bytes are consumed.
+        
+        Args:
+            method: HTTP method
+            url: Absolute URL to request
+            headers: Optional request headers
             
-            if not api_key:
-                self.errors.append(f"{name} API key is not configured")
-                continue
+        Returns:
+            HTTP status code of the response
+        """
+        async with self._http.stream(method, url, headers=headers) as response:
+            return response.status_code
+    
+    async def _probe_service(
+        self, name: str, url: str, api_key: str, path: str
+    ) -> List[str]:
+        """Check that one Arr service is configured, responding and accepts the API key.
+        
+        Args:
+            name: Display name of the service (e.g., "Radarr")
+            url: Base URL of the service
+            api_key: API key for the service
+            path: Authenticated status endpoint of the service
             
-            # Try to connect
-            try:
-                async with httpx.AsyncClient(
-                    base_url=url,
-                    headers={"X-Api-Key": api_key},
-                    timeout=10.0
-                ) as client:
-                    response = await client.get("/api/v3/system/status" if name != "Prowlarr" else "/api/v1/system/status")
-                    if response.status_code != 200:
-                        self.errors.append(f"{name} returned status {response.status_code}")
-                    else:
-                        logger.info(f"✓ {name} is accessible and responding")
-            except httpx.ConnectError:
-                self.errors.append(f"Cannot connect to {name} at {url} - connection refused")
-            except httpx.TimeoutException:
-                self.errors.append(f"{name} at {url} - request timeout (service may be unreachable)")
-            except Exception as e:
-                self.errors.append(f"{name} validation failed: {str(e)}")
+        Returns:
+            List of error messages, empty if the service is reachable
+        """
+        if not url:
+            return [f"{name} URL is not configured"]
+        
+        if not api_key:
+            return [f"{name} API key is not configured"]
+        
+        # The status endpoint requires the API key, so it checks the key as well
+        # as reachability; only its status line is read, never the body
+        try:
+            status = await self._status_of(
+                "GET", url.rstrip("/") + path, {"X-Api-Key": api_key}
+            )
+            if status in (401, 403):
+                return [f"{name} rejected the API key (status {status})"]
+            if status != 200:
+                return [f"{name} returned status {status}"]
+            logger.info(f"✓ {name} is accessible and responding")
+        except httpx.ConnectError:
+            return [f"Cannot connect to {name} at {url} - connection refused"]
+        except httpx.TimeoutException:
+            return [f"{name} at {url} - request timeout (service may be unreachable)"]
+        except Exception as e:
+            return [f"{name} validation failed: {str(e)}"]
+        
+        return []
     
     async def _validate_database(self) -> None:
         """Validate database configuration and connectivity."""
@@ -97,8 +211,9 @@ class ConfigurationValidator:
         
         # Try to connect to database
         try:
-            async with engine.begin() as conn:
-                await conn.execute("SELECT 1")
+            # A plain connection is enough for a ping; no BEGIN/COMMIT needed
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
             logger.info(f"✓ Database is accessible: {settings.database_url.split('://')[0]}")
         except Exception as e:
             self.errors.append(f"Cannot connect to database: {str(e)}")
@@ -114,31 +229,38 @@ class ConfigurationValidator:
             self.errors.append("DISCOVERY_ENABLED=true but no DISCOVERY_SOURCES configured")
             return
         
-        # Try to fetch from one source
-        for i, source in enumerate(settings.discovery_sources[:1]):  # Test first source
-            try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(source)
-                    if response.status_code == 200:
-                        logger.info(f"✓ Discovery source {i+1} is accessible")
-                    else:
-                        self.warnings.append(
-                            f"Discovery source {i+1} returned status {response.status_code}"
-                        )
-            except Exception as e:
-                self.warnings.append(f"Discovery source {i+1} not reachable: {str(e)}")
+        # Probe every source concurrently over the shared pooled client; only
+        # the status matters, so source bodies are never downloaded
+        results = await asyncio.gather(
+            *[self._status_of("GET", source) for source in settings.discovery_sources],
+            return_exceptions=True,
+        )
+        
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                self.warnings.append(f"Discovery source {i+1} not reachable: {str(result)}")
+            elif result == 200:
+                logger.info(f"✓ Discovery source {i+1} is accessible")
+            else:
+                self.warnings.append(f"Discovery source {i+1} returned status {result}")
 
 
-async def validate_startup_configuration() -> None:
+async def validate_startup_configuration(force: bool = False) -> None:
     """Validate configuration and raise on error.
     
     Should be called during application startup.
     
+    Args:
+        force: Re-run the checks even if a recent result is cached
+    
     Raises:
         RuntimeError: If configuration is invalid
     """
     validator = ConfigurationValidator()
-    success, errors, warnings = await validator.validate_all()
+    try:
+        success, errors, warnings = await validator.validate_all(force=force)
+    finally:
+        await validator.aclose()
     
     if not success:
         error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
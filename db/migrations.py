@@ -3,8 +3,11 @@
 Supports schema versioning and migration tracking for safe upgrades.
 """
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Integer, DateTime
+from sqlalchemy import String, Integer, DateTime, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 from loguru import logger
 
@@ -29,8 +32,9 @@ class SchemaMigration(Base):
     
     # When this migration was applied
     applied_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False
     )
     
@@ -42,7 +46,15 @@ class SchemaMigration(Base):
 
 
 class MigrationManager:
-    """Manages database migrations for version upgrades."""
+    """Manages database migrations for version upgrades.
+    
+    Can be used as an async context manager to share one session across a
+    migration run; outside of one, each call opens its own session::
+    
+        async with MigrationManager(engine) as manager:
+            await manager.initialize_migrations_table()
+            applied = await manager.get_applied_migrations()
+    """
     
     def __init__(self, engine: any) -> None:
         """Initialize migration manager.
@@ -52,6 +64,25 @@ class MigrationManager:
         """
         self.engine = engine
         self.applied_migrations: set = set()
+        self._session: Optional[AsyncSession] = None
+    
+    async def __aenter__(self) -> "MigrationManager":
+        self._session = AsyncSession(self.engine)
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+    
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Yield the shared session if one is open, else a short-lived one."""
+        if self._session is not None:
+            yield self._session
+            return
+        async with AsyncSession(self.engine) as session:
+            yield session
     
     async def initialize_migrations_table(self) -> None:
         """Create migrations tracking table if it doesn't exist."""
@@ -67,11 +98,10 @@ class MigrationManager:
     async def get_applied_migrations(self) -> set:
         """Get set of migration versions that have been applied."""
         from sqlalchemy import select
-        from sqlalchemy.ext.asyncio import AsyncSession
         
         logger.debug("Checking applied migrations")
         try:
-            async with AsyncSession(self.engine) as session:
+            async with self._session_scope() as session:
                 result = await session.execute(select(SchemaMigration.version))
                 return set(result.scalars().all())
         except Exception as e:
@@ -85,18 +115,21 @@ class MigrationManager:
             version: Migration version identifier
             description: Human-readable description
         """
-        from sqlalchemy.ext.asyncio import AsyncSession
-        
         logger.info(f"Recording migration: {version}")
         try:
-            async with AsyncSession(self.engine) as session:
+            async with self._session_scope() as session:
                 migration = SchemaMigration(
                     version=version,
                     description=description,
                     applied_at=utc_now()
                 )
                 session.add(migration)
-                await session.commit()
+                try:
+                    await session.commit()
+                except Exception:
+                    # Keep a shared session usable for the rest of the run
+                    await session.rollback()
+                    raise
             logger.info(f"Migration {version} recorded")
         except Exception as e:
             logger.error(f"Failed to record migration {version}: {e}")
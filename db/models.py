@@ -1,8 +1,10 @@
 """Database models for storing indexer health check history and audit trail."""
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Integer, DateTime, Boolean, Index
-from datetime import datetime
+from sqlalchemy import String, Integer, DateTime, Boolean, Index, func, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 
 class Base(DeclarativeBase):
@@ -37,19 +39,42 @@ class IndexerHealth(Base):
     # Error message if check failed (null if successful)
     error: Mapped[str | None] = mapped_column(String(512), nullable=True)
     
-    # Timestamp of when this check was performed
+    # Timestamp of when this check was performed (the server default also covers
+    # rows written outside the ORM)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False
     )
     
-    # Index for faster queries by service and timestamp
+    # Index for faster queries by service and timestamp, plus a newest-first
+    # composite index so the latest checks of one indexer need no sort (on
+    # PostgreSQL it also covers the result columns)
     __table_args__ = (
         Index("idx_service_timestamp", "service", "timestamp"),
-        Index("idx_indexer_id", "indexer_id"),
+        Index(
+            "idx_service_indexer_ts",
+            "service",
+            "indexer_id",
+            text("timestamp DESC"),
+            postgresql_include=["success", "error"],
+        ),
     )
     
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """Insert many health records in a single executemany round trip.
+        
+        Bypasses the ORM unit of work; the caller still commits the session.
+        
+        Args:
+            session: Session to execute the INSERT on
+            rows: Column mappings, one per record (timestamp may be omitted)
+        """
+        if rows:
+            await session.execute(insert(cls), rows)
+    
     def __repr__(self) -> str:
         status = "OK" if self.success else f"FAIL: {self.error[:30]}"
         return f"<IndexerHealth {self.service}/{self.name} {status}>"
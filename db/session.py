@@ -1,15 +1,51 @@
 """Database session and initialization."""
 
+from pathlib import Path
+from typing import Any, Dict
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from config.settings import settings
 from db.models import Base
 from loguru import logger
+from sqlalchemy.pool import NullPool, StaticPool
 
-# Create async engine with connection pooling
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """Build create_async_engine pool options suited to the database backend.
+
+    SQLite files are opened per session (NullPool), since a queue of
+    aiosqlite connections only adds thread overhead; in-memory SQLite shares
+    a single connection so every session sees the same database. Server
+    databases get a sized, recycled pool, and asyncpg has JIT disabled
+    because the queries here are short.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        if ":memory:" in database_url or database_url.endswith("://"):
+            return {"poolclass": StaticPool}
+        return {"poolclass": NullPool}
+
+    options: Dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": 1800,
+    }
+    if database_url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {"server_settings": {"jit": "off"}}
+    return options
+
+
+# Create async engine with backend-appropriate connection pooling
 engine = create_async_engine(
     settings.database_url,
     echo=False,  # Set to True for SQL logging in debug mode
     pool_pre_ping=True,  # Test connections before using them
+    **_engine_options(settings.database_url),
 )
 
 # Create async session factory
@@ -20,16 +56,35 @@ SessionLocal = async_sessionmaker(
 )
 
 
+def _create_missing_indexes(sync_conn: Connection) -> None:
+    """Create any model index that an existing table does not have yet.
+
+    Args:
+        sync_conn: Synchronous connection from AsyncConnection.run_sync
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db() -> None:
     """Initialize the database by creating all tables.
     
     This should be called during application startup. It creates all tables
-    defined in the models if they don't already exist.
+    defined in the models if they don't already exist, and any of their
+    indexes that are missing from tables created by an older version.
     """
     logger.info("Initializing database")
     try:
+        # Make sure the SQLite database directory exists before connecting
+        if settings.database_url.startswith("sqlite+aiosqlite:///"):
+            db_path = settings.database_url.replace("sqlite+aiosqlite:///", "")
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips tables that already exist, so indexes added to
+            # the models since a database was created are built here
+            await conn.run_sync(_create_missing_indexes)
         logger.info("Database initialization successful")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -7,19 +7,24 @@ Main application entry point. Initializes FastAPI application with:
 - Scheduler for periodic health checks and autoheal cycles
 """
 
-from typing import AsyncGenerator, Optional
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Dict, Optional
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+import httpx
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic_core import to_json
 
 from config.settings import settings
 from core.logging import configure_debug_logging
-from core.http import ArrHttpClient
+from core.http import ArrHttpClient, create_http_client
 from services.radarr import RadarrService
 from services.sonarr import SonarrService
 from services.prowlarr import ProwlarrService
@@ -28,6 +33,7 @@ from agents.indexer_control_agent import IndexerControlAgent
 from agents.indexer_autoheal_agent import IndexerAutoHealAgent
 from agents.indexer_discovery_agent import IndexerDiscoveryAgent
 from agents.orchestrator import AgentOrchestrator
+from agents.base import AgentResult
 from agents.monitor import AgentMonitor, EventType
 from db.session import init_db, close_db, SessionLocal
 from db.models import IndexerHealth
@@ -43,8 +49,10 @@ from api.schemas import (
     HealthHistoryResponse,
     DetailedStatsResponse,
     AgentStatusResponse,
+    OrchestratorStatusResponse,
+    MonitorStatusResponse,
 )
-from core.monitoring import metrics_collector, event_log, startup_status
+from core.monitoring import metrics_collector, get_event_log, startup_status
 
 
 # Get current UTC time in a timezone-aware manner
@@ -56,10 +64,25 @@ def utc_now() -> datetime:
 def _create_scheduler() -> AsyncIOScheduler:
     """Create and configure the APScheduler scheduler.
     
+    Coroutine jobs (the agents) run on the event loop; the "threads" executor
+    is available for blocking jobs so they stay off it. Every job coalesces
+    missed runs into one, never overlaps itself, and skips a run that is more
+    than a minute late instead of catching up.
+    
     Returns:
         Configured AsyncIOScheduler instance ready for job registration
     """
-    sched = AsyncIOScheduler()
+    sched = AsyncIOScheduler(
+        executors={
+            "default": AsyncIOExecutor(),
+            "threads": ThreadPoolExecutor(max_workers=4),
+        },
+        job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": 60,
+        },
+    )
     return sched
 
 
@@ -70,7 +93,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     This context manager handles:
     - Configuration validation at startup
     - Debug logging configuration
-    - Database initialization
+    - Database initialization (overlapped with the service and agent setup)
     - Service instantiation (HTTP clients and service wrappers)
     - Agent creation
     - Scheduler creation and startup
@@ -94,62 +117,108 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         logger.critical(f"Configuration validation failed: {e}")
         raise
     
-    # Initialize database
+    # Initialize the database in the background; it shares nothing with the
+    # client and agent construction below and is awaited before any agent runs
+    db_ready = asyncio.create_task(init_db())
+
+    # Anything started before the database is ready is stopped and awaited if
+    # startup fails part way, so no task is left orphaned
+    warm_up: Optional[asyncio.Future] = None
+    http_client: Optional[httpx.AsyncClient] = None
     try:
-        await init_db()
-    except Exception as e:
-        logger.critical(f"Database initialization failed: {e}")
-        raise
+        # Create HTTP clients with API authentication, all sending through one
+        # connection pool so services behind the same host share connections
+        logger.info("Initializing HTTP clients for Arr services")
+        http_client = create_http_client()
+        app.state.http_client = http_client
+        # Health and autoheal agents may test indexers at the same time; bound the
+        # combined load on each service rather than per agent
+        radarr_client = ArrHttpClient(
+            settings.radarr_url,
+            settings.radarr_api_key,
+            max_in_flight=settings.arr_max_concurrency,
+            client=http_client,
+        )
+        sonarr_client = ArrHttpClient(
+            settings.sonarr_url,
+            settings.sonarr_api_key,
+            max_in_flight=settings.arr_max_concurrency,
+            client=http_client,
+        )
+        # Discovery adds POST to Prowlarr in bursts; allow one in flight per add
+        prowlarr_client = ArrHttpClient(
+            settings.prowlarr_url,
+            settings.prowlarr_api_key,
+            max_in_flight=settings.discovery_max_concurrency,
+            client=http_client,
+        )
 
-    # Create HTTP clients with API authentication
-    logger.info("Initializing HTTP clients for Arr services")
-    radarr_client = ArrHttpClient(settings.radarr_url, settings.radarr_api_key)
-    sonarr_client = ArrHttpClient(settings.sonarr_url, settings.sonarr_api_key)
-    prowlarr_client = ArrHttpClient(settings.prowlarr_url, settings.prowlarr_api_key)
-
-    # Create service wrappers
-    logger.info("Initializing service wrappers")
-    radarr = RadarrService(radarr_client)
-    sonarr = SonarrService(sonarr_client)
-    prowlarr = ProwlarrService(prowlarr_client)
-
-    # Store on app.state for later use by handlers and tests
-    app.state.radarr = radarr
-    app.state.sonarr = sonarr
-    app.state.prowlarr = prowlarr
-
-    # Create agents
-    logger.info("Initializing autonomous agents")
-    health_agent = IndexerHealthAgent(radarr, sonarr)
-    control_agent = IndexerControlAgent(radarr, sonarr)
-    autoheal_agent = IndexerAutoHealAgent(radarr, sonarr, control_agent)
-    discovery_agent = IndexerDiscoveryAgent(prowlarr if settings.discovery_add_to_prowlarr else None)
-    
-    # Attach agents to app.state for endpoint access and tests
-    app.state.health_agent = health_agent
-    app.state.control_agent = control_agent
-    app.state.autoheal_agent = autoheal_agent
-    app.state.discovery_agent = discovery_agent
-
-    # Create and initialize orchestrator with all agents
-    logger.info("Initializing agent orchestrator")
-    orchestrator = AgentOrchestrator(name="IndexerControlOrchestrator")
-    monitor = AgentMonitor(max_event_history=5000)
-    
-    # Register agents with orchestrator and schedules
-    orchestrator.register_agent(health_agent, interval_seconds=30 * 60)  # 30 minutes
-    orchestrator.register_agent(autoheal_agent, interval_seconds=2 * 60 * 60)  # 2 hours
-    orchestrator.register_agent(control_agent)  # On-demand only
+        # Handshake with all three services in the background while the rest of
+        # startup proceeds, so the initial agent runs start on warm connections
+        warm_up = asyncio.gather(
+            radarr_client.warm_up(), sonarr_client.warm_up(), prowlarr_client.warm_up()
+        )
+
+        # Create service wrappers
+        logger.info("Initializing service wrappers")
+        radarr = RadarrService(radarr_client)
+        sonarr = SonarrService(sonarr_client)
+        prowlarr = ProwlarrService(prowlarr_client)
+
+        # Store on app.state for later use by handlers and tests
+        app.state.radarr = radarr
+        app.state.sonarr = sonarr
+        app.state.prowlarr = prowlarr
+
+        # Create agents
+        logger.info("Initializing autonomous agents")
+        health_agent = IndexerHealthAgent(radarr, sonarr)
+        control_agent = IndexerControlAgent(radarr, sonarr)
+        autoheal_agent = IndexerAutoHealAgent(radarr, sonarr, control_agent)
+        discovery_agent = IndexerDiscoveryAgent(
+            prowlarr if settings.discovery_add_to_prowlarr else None,
+            max_concurrency=settings.discovery_max_concurrency,
+        )
     
-    if settings.discovery_enabled:
-        orchestrator.register_agent(
-            discovery_agent,
-            interval_seconds=settings.discovery_interval_hours * 60 * 60,
+        # Attach agents to app.state for endpoint access and tests
+        app.state.health_agent = health_agent
+        app.state.control_agent = control_agent
+        app.state.autoheal_agent = autoheal_agent
+        app.state.discovery_agent = discovery_agent
+
+        # Create and initialize orchestrator with all agents
+        logger.info("Initializing agent orchestrator")
+        orchestrator = AgentOrchestrator(
+            name="IndexerControlOrchestrator",
+            status_cache_ttl=settings.status_cache_ttl_seconds,
         )
+        monitor = AgentMonitor(max_event_history=5000)
+    
+        # Register agents with orchestrator and schedules
+        orchestrator.register_agent(health_agent, interval_seconds=30 * 60)  # 30 minutes
+        orchestrator.register_agent(autoheal_agent, interval_seconds=2 * 60 * 60)  # 2 hours
+        orchestrator.register_agent(control_agent)  # On-demand only
+    
+        if settings.discovery_enabled:
+            orchestrator.register_agent(
+                discovery_agent,
+                interval_seconds=settings.discovery_interval_hours * 60 * 60,
+            )
     
-    app.state.orchestrator = orchestrator
-    app.state.monitor = monitor
+        app.state.orchestrator = orchestrator
+        app.state.monitor = monitor
     
+        await db_ready
+    except BaseException as e:
+        logger.critical(f"Startup failed: {e}")
+        pending = [task for task in (db_ready, warm_up) if task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if http_client is not None:
+            await http_client.aclose()
+        raise
+
     # Create and configure legacy scheduler for backwards compatibility
     logger.info("Initializing scheduler (legacy compatibility)")
     scheduler: AsyncIOScheduler = _create_scheduler()
@@ -159,8 +228,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         minutes=30,
         id="health_agent",
         name="Indexer Health Check (every 30 minutes)",
-        coalesce=True,
-        max_instances=1,
     )
     scheduler.add_job(
         autoheal_agent.run,
@@ -168,8 +235,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         hours=2,
         id="autoheal_agent",
         name="Indexer Autoheal (every 2 hours)",
-        coalesce=True,
-        max_instances=1,
     )
     # Schedule discovery agent if enabled
     if settings.discovery_enabled:
@@ -179,8 +244,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             hours=settings.discovery_interval_hours,
             id="discovery_agent",
             name="Indexer Discovery",
-            coalesce=True,
-            max_instances=1,
         )
     scheduler.start()
     logger.info("Scheduler started with jobs configured")
@@ -189,6 +252,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     # Mark startup as starting
     startup_status.mark_startup_start()
+    await warm_up
     
     # Run initial health check immediately on startup for professional responsiveness
     logger.info("Running initial health check on startup...")
@@ -238,21 +302,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         except Exception as e:
             logger.error(f"Error during scheduler shutdown: {e}")
 
-    # Close HTTP clients if present
+    # Close the event log only if something opened it
+    if get_event_log.cache_info().currsize:
+        get_event_log().close()
+
+    # Release HTTP clients, agent-held resources (such as the shared discovery
+    # HTTP client) and the database concurrently, so one slow close does not
+    # hold up the others; each failure is logged without aborting the rest
+    closers: Dict[str, Awaitable[Any]] = {}
     for svc_name in ("radarr", "sonarr", "prowlarr"):
         svc = getattr(app.state, svc_name, None)
         if svc and getattr(svc, "client", None):
-            try:
-                await svc.client.close()
-                logger.debug(f"Closed {svc_name} HTTP client")
-            except Exception as e:
-                logger.error(f"Error closing {svc_name} client: {e}")
-    
-    # Close database connection
-    try:
-        await close_db()
-    except Exception as e:
-        logger.error(f"Error closing database: {e}")
+            closers[f"{svc_name} client"] = svc.client.close()
+
+    # Connection pool shared by the service clients
+    http_client_instance = getattr(app.state, "http_client", None)
+    if http_client_instance is not None:
+        closers["shared HTTP client"] = http_client_instance.aclose()
+
+    discovery = getattr(app.state, "discovery_agent", None)
+    if discovery:
+        closers["discovery agent"] = discovery.cleanup()
+
+    closers["database"] = close_db()
+
+    results = await asyncio.gather(*closers.values(), return_exceptions=True)
+    for label, outcome in zip(closers, results, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error closing {label}: {outcome}")
+        else:
+            logger.debug(f"Closed {label}")
     
     logger.info(f"{settings.app_name} shutdown completed")
 
@@ -816,7 +895,7 @@ async def get_recent_events(limit: int = 50) -> dict:
     Returns:
         Recent events from the event log
     """
-    events = event_log.get_recent_events(limit=limit)
+    events = get_event_log().get_recent_events(limit=limit)
     return {
         "timestamp": utc_now().isoformat(),
         "events_count": len(events),
@@ -833,8 +912,22 @@ async def get_startup_status() -> dict:
     """
     return startup_status.get_status()
 
-@app.get("/orchestrator/status", tags=["orchestrator"])
-async def get_orchestrator_status() -> dict:
+def _json_response(payload: dict) -> Response:
+    """Serialize a server-built status payload straight to JSON.
+
+    Skips FastAPI's response validation and jsonable_encoder pass, which only
+    re-walk dicts that already contain JSON-ready values.
+    """
+    return Response(content=to_json(payload), media_type="application/json")
+
+
+@app.get(
+    "/orchestrator/status",
+    tags=["orchestrator"],
+    response_model=OrchestratorStatusResponse,
+    response_class=Response,
+)
+async def get_orchestrator_status() -> Response:
     """Get comprehensive orchestrator status and metrics.
     
     Returns:
@@ -846,14 +939,19 @@ async def get_orchestrator_status() -> dict:
     """
     try:
         orchestrator = app.state.orchestrator
-        return orchestrator.get_status()
+        return _json_response(orchestrator.get_status())
     except Exception as e:
         logger.error(f"Error getting orchestrator status: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting orchestrator status: {str(e)}")
 
 
-@app.get("/monitor/health", tags=["orchestrator"])
-async def get_monitor_health() -> dict:
+@app.get(
+    "/monitor/health",
+    tags=["orchestrator"],
+    response_model=MonitorStatusResponse,
+    response_class=Response,
+)
+async def get_monitor_health() -> Response:
     """Get agent health monitoring status.
     
     Returns:
@@ -865,7 +963,7 @@ async def get_monitor_health() -> dict:
     """
     try:
         monitor = app.state.monitor
-        return monitor.get_status_summary()
+        return _json_response(monitor.get_status_summary())
     except Exception as e:
         logger.error(f"Error getting monitor health: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting monitor health: {str(e)}")
@@ -907,44 +1005,60 @@ async def get_monitor_events(
         raise HTTPException(status_code=500, detail=f"Error getting monitor events: {str(e)}")
 
 
+def _record_agent_result(agent_name: str, result: AgentResult) -> None:
+    """Record an on-demand agent run in the monitor."""
+    monitor = app.state.monitor
+    monitor.record_event(
+        EventType.AGENT_COMPLETED if result.success else EventType.AGENT_FAILED,
+        agent_name=agent_name,
+        message=result.message,
+        metadata=result.metrics or {},
+    )
+    monitor.update_agent_health(agent_name, success=result.success, error=result.error)
+
+
+def _agent_result_payload(agent_name: str, result: AgentResult) -> dict:
+    """Build the API representation of an agent run result."""
+    return {
+        "agent": agent_name,
+        "success": result.success,
+        "message": result.message,
+        "metrics": result.metrics or {},
+        "error": result.error,
+        "timestamp": result.timestamp.isoformat(),
+    }
+
+
 @app.post("/orchestrator/agent/{agent_name}/run", tags=["orchestrator"])
-async def trigger_agent_on_demand(agent_name: str) -> dict:
+async def trigger_agent_on_demand(agent_name: str, background: bool = False) -> dict:
     """Trigger a registered agent to run on-demand.
     
     Args:
         agent_name: Name of the agent to execute
+        background: Return immediately with a task ID instead of waiting;
+            poll GET /orchestrator/tasks/{task_id} for the result
         
     Returns:
-        Execution result with success status and metrics
+        Execution result with success status and metrics, or the task ID
     """
     try:
         orchestrator = app.state.orchestrator
-        monitor = app.state.monitor
         
         logger.info(f"Triggering on-demand execution of agent: {agent_name}")
+
+        if background:
+            task_id = orchestrator.start_background(
+                agent_name, on_complete=lambda result: _record_agent_result(agent_name, result)
+            )
+            if task_id is None:
+                raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
+            return {"agent": agent_name, "task_id": task_id, "status": "running"}
         
         result = await orchestrator.execute_agent(agent_name)
         
         if result:
-            # Record event in monitor
-            monitor.record_event(
-                EventType.AGENT_COMPLETED if result.success else EventType.AGENT_FAILED,
-                agent_name=agent_name,
-                message=result.message,
-                metadata=result.metrics or {},
-            )
-            
-            # Update health status
-            monitor.update_agent_health(agent_name, success=result.success, error=result.error)
-            
-            return {
-                "agent": agent_name,
-                "success": result.success,
-                "message": result.message,
-                "metrics": result.metrics or {},
-                "error": result.error,
-                "timestamp": result.timestamp.isoformat(),
-            }
+            _record_agent_result(agent_name, result)
+            return _agent_result_payload(agent_name, result)
         else:
             raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found or already running")
     
@@ -955,6 +1069,30 @@ async def trigger_agent_on_demand(agent_name: str) -> dict:
         raise HTTPException(status_code=500, detail=f"Error triggering agent: {str(e)}")
 
 
+@app.get("/orchestrator/tasks/{task_id}", tags=["orchestrator"])
+async def get_background_task(task_id: str) -> dict:
+    """Get the state of a background agent run.
+    
+    Args:
+        task_id: Task ID returned by a background run request
+        
+    Returns:
+        Task status and, once completed, the execution result
+    """
+    state = app.state.orchestrator.get_task_result(task_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
+
+    result = state["result"]
+    return {
+        "task_id": task_id,
+        "agent": state["agent"],
+        "status": state["status"],
+        "result": _agent_result_payload(state["agent"], result) if result else None,
+        "error": state.get("error"),
+    }
+
+
 @app.post("/orchestrator/agent/{agent_name}/enable", tags=["orchestrator"])
 async def enable_agent_endpoint(agent_name: str) -> dict:
     """Enable a registered agent.
@@ -176,3 +176,302 @@ async def test_indexer_health_agent_handles_failures():
     await agent.run()
 
     mock_radarr.test_indexer.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_autoheal_agent_bounds_concurrent_tests():
+    """Test that autoheal runs indexer tests concurrently up to max_concurrency."""
+    import asyncio
+
+    mock_radarr = AsyncMock()
+    mock_sonarr = AsyncMock()
+    mock_control = AsyncMock()
+
+    mock_radarr.get_indexers.return_value = [
+        {"id": i, "name": f"Indexer {i}", "enable": True} for i in range(6)
+    ]
+    mock_sonarr.get_indexers.return_value = []
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_test(indexer_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"success": True}
+
+    mock_radarr.test_indexer.side_effect = slow_test
+
+    agent = IndexerAutoHealAgent(mock_radarr, mock_sonarr, mock_control, max_concurrency=2)
+    await agent.run()
+
+    assert mock_radarr.test_indexer.call_count == 6
+    assert peak == 2
+    mock_control.disable_indexer.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_parses_json_and_text_sources():
+    """Test that discovery parses JSON arrays and newline-separated URL lists."""
+    import httpx
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/list.json":
+            return httpx.Response(200, json=[{"name": "One"}, "http://two.example"])
+        if request.url.path == "/untyped":
+            return httpx.Response(
+                200,
+                text='{"indexers": [{"name": "Three"}]}',
+                headers={"content-type": "text/plain"},
+            )
+        return httpx.Response(
+            200,
+            text="# comment\nhttp://a.example\n\n  http://b.example  \n",
+            headers={"content-type": "text/plain"},
+        )
+
+    agent = IndexerDiscoveryAgent()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert len(await agent._process_source(client, "http://src.example/list.json")) == 2
+        assert len(await agent._process_source(client, "http://src.example/list.txt")) == 2
+        assert len(await agent._process_source(client, "http://src.example/untyped")) == 1
+
+
+def test_discovery_agent_parses_text_lists():
+    """Test that text lists skip blanks and comments and strip each line."""
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    text = "# header\r\n  http://a.example  \r\n\r\n   # indented comment\nhttp://b.example/#x"
+    assert IndexerDiscoveryAgent._parse_text_candidates(text) == [
+        {"baseUrl": "http://a.example"},
+        {"baseUrl": "http://b.example/#x"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_streams_chunked_json_arrays():
+    """Test that JSON arrays of unknown length are decoded across chunk boundaries."""
+    import httpx
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    async def chunks(parts):
+        for part in parts:
+            yield part
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/truncated.json":
+            parts = (b'[{"name": "One"}, {"na',)
+        else:
+            parts = (b'[ {"name": "O', b'ne"}, "http://two.ex', b'ample",', b' {"name": "Three"}]')
+        return httpx.Response(
+            200, content=chunks(parts), headers={"content-type": "application/json"}
+        )
+
+    agent = IndexerDiscoveryAgent()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert len(await agent._process_source(client, "http://src.example/big.json")) == 3
+        with pytest.raises(ValueError):
+            await agent._process_source(client, "http://src.example/truncated.json")
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_streams_items_larger_than_a_chunk():
+    """Test that an item spanning many chunks, with escapes split across them, decodes."""
+    import httpx
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    body = (
+        '[{"name": "Big", "description": "' + "x" * 50_000 + '\\"quoted\\"}", '
+        '"tags": [{"a": "]"}]}, "http://two.example"]'
+    ).encode()
+
+    async def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i:i + 7]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=chunks(), headers={"content-type": "application/json"}
+        )
+
+    agent = IndexerDiscoveryAgent()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        candidates = await agent._process_source(client, "http://src.example/big.json")
+
+    assert candidates[0]["description"].endswith('x"quoted"}')
+    assert candidates[0]["tags"] == [{"a": "]"}]
+    assert candidates[1] == {"baseUrl": "http://two.example"}
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_caches_and_revalidates_sources(monkeypatch):
+    """Test that sources are reused within the TTL and revalidated with their ETag."""
+    import httpx
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+    from config.settings import settings
+
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=["http://a.example"], headers={"etag": '"v1"'})
+
+    agent = IndexerDiscoveryAgent()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        monkeypatch.setattr(settings, "discovery_cache_ttl_seconds", 3600)
+        assert len(await agent._process_source(client, "http://src.example/list.json")) == 1
+        assert len(await agent._process_source(client, "http://src.example/list.json")) == 1
+        assert seen_etags == [None]
+
+        monkeypatch.setattr(settings, "discovery_cache_ttl_seconds", 0)
+        assert len(await agent._process_source(client, "http://src.example/list.json")) == 1
+        assert seen_etags == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_remembers_mislabelled_text_sources(monkeypatch):
+    """Test that a source serving text as JSON is only JSON-decoded once."""
+    import httpx
+    from agents import indexer_discovery_agent
+    from config.settings import settings
+
+    decodes = []
+    real_loads = indexer_discovery_agent._loads
+
+    def counting_loads(data):
+        decodes.append(data)
+        return real_loads(data)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, text="http://a.example\nhttp://b.example\n",
+            headers={"content-type": "application/json"},
+        )
+
+    monkeypatch.setattr(indexer_discovery_agent, "_loads", counting_loads)
+    monkeypatch.setattr(settings, "discovery_cache_ttl_seconds", 0)
+
+    agent = indexer_discovery_agent.IndexerDiscoveryAgent()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert len(await agent._process_source(client, "http://src.example/list")) == 2
+        assert len(await agent._process_source(client, "http://src.example/list")) == 2
+
+    assert len(decodes) == 1
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_adds_candidates_to_prowlarr():
+    """Test that every candidate is posted to Prowlarr even if some fail."""
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    mock_prowlarr = MagicMock()
+    mock_prowlarr.client.post = AsyncMock(side_effect=[None, Exception("rejected"), None])
+
+    agent = IndexerDiscoveryAgent(mock_prowlarr, max_concurrency=2)
+    await agent._add_to_prowlarr([{"name": "A"}, {"name": "B"}, {"name": "C"}])
+
+    assert mock_prowlarr.client.post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_skips_duplicate_prowlarr_adds():
+    """Test that candidates sharing a baseUrl are only posted once."""
+    from agents.indexer_discovery_agent import IndexerDiscoveryAgent
+
+    mock_prowlarr = MagicMock()
+    mock_prowlarr.client.post = AsyncMock()
+
+    agent = IndexerDiscoveryAgent(mock_prowlarr)
+    await agent._add_to_prowlarr(
+        [{"baseUrl": "http://a.example"}, {"baseUrl": "http://a.example"}, {"name": "B"}]
+    )
+
+    assert mock_prowlarr.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_reuses_and_closes_shared_client():
+    """Test that discovery reuses one HTTP client until cleanup."""
+    from agents import indexer_discovery_agent
+
+    first = await indexer_discovery_agent._get_client()
+    assert await indexer_discovery_agent._get_client() is first
+
+    await indexer_discovery_agent.IndexerDiscoveryAgent().cleanup()
+    assert first.is_closed
+    assert indexer_discovery_agent._client is None
+
+
+@pytest.mark.asyncio
+async def test_discovery_agent_run_fans_out_sources(monkeypatch):
+    """Test that discovery fetches all sources, counts failed ones and adds each indexer once."""
+    import httpx
+    from agents import indexer_discovery_agent
+    from config.settings import settings
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down.example":
+            return httpx.Response(503)
+        return httpx.Response(200, json=["http://a.example", "http://b.example"])
+
+    monkeypatch.setattr(settings, "discovery_enabled", True)
+    monkeypatch.setattr(settings, "discovery_add_to_prowlarr", True)
+    monkeypatch.setattr(
+        settings,
+        "discovery_sources",
+        ["http://one.example", "http://down.example", "http://two.example"],
+    )
+    monkeypatch.setattr(
+        indexer_discovery_agent,
+        "_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    mock_prowlarr = MagicMock()
+    mock_prowlarr.client.post = AsyncMock()
+
+    agent = indexer_discovery_agent.IndexerDiscoveryAgent(mock_prowlarr, max_concurrency=1)
+    result = await agent.run()
+    await agent.cleanup()
+
+    assert result.success is False
+    assert result.metrics["total_discovered"] == 4
+    assert result.metrics["failed_sources"] == 1
+    # Both healthy sources list the same two indexers
+    assert mock_prowlarr.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_health_agent_tests_indexers_concurrently():
+    """Test that both services' indexer tests share one max_concurrency budget."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_test(indexer_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    services = []
+    for _ in range(2):
+        service = AsyncMock()
+        service.get_indexers.return_value = [{"id": i, "name": f"Idx {i}"} for i in range(4)]
+        service.test_indexer.side_effect = slow_test
+        services.append(service)
+
+    agent = IndexerHealthAgent(*services, max_concurrency=3)
+    result = await agent.run()
+
+    assert result.success is True
+    assert sum(s.test_indexer.call_count for s in services) == 8
+    assert peak == 3
@@ -128,6 +128,17 @@ class TestAgentBase:
         assert "OtherAgent" in simple_agent.dependencies
         assert len(simple_agent.dependencies) == 1
 
+    def test_agent_dependency_registration_deduplicates(self, simple_agent):
+        """Test duplicate dependencies are ignored and order is preserved."""
+        for dep in ("B", "A", "B", "C", "A"):
+            simple_agent.register_dependency(dep)
+        assert simple_agent.dependencies == ["B", "A", "C"]
+
+    def test_agent_result_timestamp_is_timezone_aware(self):
+        """Test AgentResult timestamps default to aware UTC datetimes."""
+        result = AgentResult(success=True, message="ok")
+        assert result.timestamp.tzinfo is timezone.utc
+
     def test_agent_status(self, simple_agent):
         """Test agent status reporting."""
         status = simple_agent.get_status()
@@ -161,6 +172,121 @@ class TestAgentMetrics:
         metrics.total_duration_seconds = 10.0
         assert metrics.average_duration == 2.5
 
+    def test_metrics_formatted_rates_track_updates(self):
+        """Test formatted rates are refreshed when counters change."""
+        metrics = AgentMetrics()
+        assert metrics.formatted_rates() == ("0.0%", "0.00s")
+        metrics.total_runs = 4
+        metrics.successful_runs = 3
+        metrics.total_duration_seconds = 5.0
+        assert metrics.formatted_rates() == ("75.0%", "1.25s")
+
+
+# Tests for Agent Chain
+class TestAgentChain:
+    """Test dependency-ordered agent chain execution."""
+
+    def test_execution_order_respects_priority_and_dependencies(self):
+        """Test that dependencies run first and priority breaks ties."""
+        chain = AgentChain()
+        low = MockAgent("Low", priority=AgentPriority.LOW)
+        critical = MockAgent("Critical", priority=AgentPriority.CRITICAL)
+        normal_b = MockAgent("NormalB")
+        normal_a = MockAgent("NormalA")
+        critical.register_dependency("Low")
+
+        for agent in (low, critical, normal_b, normal_a):
+            chain.register(agent)
+
+        assert chain._resolve_execution_order() == ["NormalA", "NormalB", "Low", "Critical"]
+
+    @pytest.mark.asyncio
+    async def test_execution_order_cached_until_register(self):
+        """Test that the resolved order is reused and invalidated on register."""
+        chain = AgentChain()
+        chain.register(MockAgent("First"))
+        await chain.execute()
+        cached = chain._order_cache
+        await chain.execute()
+        assert chain._order_cache is cached
+
+        chain.register(MockAgent("Second"))
+        assert chain._order_version != chain._version
+        results = await chain.execute()
+        assert len(results) == 2
+        assert chain.execution_order == ["First", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_execution_order_follows_later_dependency_and_priority_changes(self):
+        """Test that the cached order is re-resolved when agents change after registration."""
+        chain = AgentChain()
+        first, second = MockAgent("First"), MockAgent("Second")
+        chain.register(first)
+        chain.register(second)
+        await chain.execute()
+        assert chain.execution_order == ["First", "Second"]
+
+        first.register_dependency("Second")
+        await chain.execute()
+        assert chain.execution_order == ["Second", "First"]
+
+        third = MockAgent("Third")
+        chain.register(third)
+        await chain.execute()
+        third.priority = AgentPriority.CRITICAL
+        await chain.execute()
+        assert chain.execution_order == ["Third", "Second", "First"]
+
+        # A removed agent no longer invalidates the chain
+        chain.unregister("Third")
+        await chain.execute()
+        version = chain._version
+        third.priority = AgentPriority.LOW
+        assert chain._version == version
+
+    @pytest.mark.asyncio
+    async def test_disabled_agents_are_skipped(self):
+        """Test that disabled agents are not run or transitioned."""
+        chain = AgentChain()
+        enabled = MockAgent("Enabled")
+        disabled = MockAgent("Disabled")
+        disabled.enabled = False
+        chain.register(enabled)
+        chain.register(disabled)
+
+        results = await chain.execute()
+        assert len(results) == 1
+        assert disabled.run_count == 0
+        assert disabled.state == AgentState.IDLE
+        assert await chain.execute("Disabled") == []
+
+    @pytest.mark.asyncio
+    async def test_unregister_invalidates_execution_order(self):
+        """Test that removing an agent drops it from the cached order."""
+        chain = AgentChain()
+        chain.register(MockAgent("First"))
+        chain.register(MockAgent("Second"))
+        await chain.execute()
+
+        assert chain.unregister("First") is True
+        assert chain.unregister("Missing") is False
+        results = await chain.execute()
+        assert len(results) == 1
+        assert chain.execution_order == ["Second"]
+
+    def test_circular_dependency_detected(self):
+        """Test that circular dependencies raise ValueError."""
+        chain = AgentChain()
+        first = MockAgent("First")
+        second = MockAgent("Second")
+        first.register_dependency("Second")
+        second.register_dependency("First")
+        chain.register(first)
+        chain.register(second)
+
+        with pytest.raises(ValueError):
+            chain._resolve_execution_order()
+
 
 # Tests for Agent Orchestrator
 class TestAgentOrchestrator:
@@ -253,15 +379,58 @@ class TestAgentOrchestrator:
         assert "TestAgent" in status["schedules"]
         assert "metrics" in status
 
+    @pytest.mark.asyncio
+    async def test_status_cached_until_state_changes(self, orchestrator, simple_agent):
+        """Test that get_status is reused within the TTL and rebuilt on changes."""
+        orchestrator.register_agent(simple_agent, interval_seconds=60)
+        first = orchestrator.get_status()
+        assert orchestrator.get_status() is first
+
+        await orchestrator.execute_agent("TestAgent")
+        updated = orchestrator.get_status()
+        assert updated is not first
+        assert updated["metrics"]["total_agent_runs"] == 1
+
+        orchestrator.status_cache_ttl = 0
+        assert orchestrator.get_status() is not updated
+
     def test_agent_schedule_execution_check(self):
         """Test schedule execution check."""
+        import time
+
         schedule = AgentSchedule(agent_name="Test", interval_seconds=60)
         assert schedule.should_execute() is True
 
         # Set future execution time
-        schedule.next_execution = utc_now() + timedelta(seconds=60)
+        schedule.next_execution_mono = time.monotonic() + 60
+        assert schedule.should_execute() is False
+        assert schedule.should_execute(schedule.next_execution_mono) is True
+
+        schedule.next_execution_mono = 0.0
+        schedule.enabled = False
         assert schedule.should_execute() is False
 
+    def test_agent_schedule_iso_timestamps_follow_updates(self):
+        """Test that cached ISO timestamps are refreshed when times change."""
+        schedule = AgentSchedule(agent_name="Test", interval_seconds=60)
+        assert schedule.iso_timestamps() == (None, None)
+
+        now = utc_now()
+        schedule.update_next_execution(now)
+        assert schedule.iso_timestamps() == (
+            now.isoformat(),
+            (now + timedelta(seconds=60)).isoformat(),
+        )
+
+    def test_agent_schedule_update_with_explicit_time(self):
+        """Test schedule update reuses a caller-supplied timestamp."""
+        schedule = AgentSchedule(agent_name="Test", interval_seconds=60)
+        now = utc_now()
+        schedule.update_next_execution(now)
+
+        assert schedule.last_executed == now
+        assert schedule.next_execution == now + timedelta(seconds=60)
+
     def test_agent_schedule_update(self):
         """Test schedule time update."""
         schedule = AgentSchedule(agent_name="Test", interval_seconds=60)
@@ -301,6 +470,53 @@ class TestAgentMonitor:
                 EventType.AGENT_STARTED, agent_name="Test", message=f"Event {i}"
             )
         assert len(monitor.events) == 10
+        assert monitor.events[0].message == "Event 10"
+        assert monitor.get_events(limit=1)[0].message == "Event 19"
+
+    def test_get_events_filters_use_live_history(self):
+        """Test filtered queries match a full scan and ignore evicted events."""
+        monitor = AgentMonitor(max_event_history=5)
+        for i in range(8):
+            monitor.record_event(
+                EventType.AGENT_STARTED if i % 2 else EventType.AGENT_FAILED,
+                agent_name="A" if i < 6 else "B",
+                message=f"Event {i}",
+            )
+
+        assert [e.message for e in monitor.get_events(agent_name="A")] == [
+            "Event 5", "Event 4", "Event 3"
+        ]
+        assert [e.message for e in monitor.get_events(event_type=EventType.AGENT_FAILED)] == [
+            "Event 6", "Event 4"
+        ]
+        assert [
+            e.message
+            for e in monitor.get_events(agent_name="A", event_type=EventType.AGENT_STARTED)
+        ] == ["Event 5", "Event 3"]
+        assert monitor.get_events(agent_name="missing") == []
+
+    def test_health_to_dict_rebuilt_only_on_change(self, monitor):
+        """Test that the health dict is reused until the status changes."""
+        monitor.update_agent_health("TestAgent", success=True)
+        health = monitor.get_agent_health("TestAgent")
+
+        first = health.to_dict()
+        assert health.to_dict() is first
+
+        monitor.update_agent_health("TestAgent", success=False, error="boom")
+        updated = health.to_dict()
+        assert updated is not first
+        assert updated["last_error"] == "boom"
+        assert updated["consecutive_failures"] == 1
+
+    def test_event_timestamp_is_utc_datetime(self, monitor):
+        """Test that events expose their nanosecond timestamp as a UTC datetime."""
+        before = datetime.now(timezone.utc)
+        monitor.record_event(EventType.AGENT_STARTED, agent_name="Test")
+        event = monitor.events[0]
+
+        assert event.timestamp.tzinfo is timezone.utc
+        assert abs((event.timestamp - before).total_seconds()) < 5
 
     def test_update_agent_health_success(self, monitor):
         """Test updating agent health on success."""
@@ -340,6 +556,16 @@ class TestAgentMonitor:
         assert "Agent2" in unhealthy
         assert "Agent1" not in unhealthy
 
+    def test_recovered_agent_leaves_unhealthy_set(self, monitor):
+        """Test that a successful run clears an agent's unhealthy status."""
+        for _ in range(3):
+            monitor.update_agent_health("Agent1", success=False, error="Error")
+        assert monitor.get_status_summary()["unhealthy_agents"] == 1
+
+        monitor.update_agent_health("Agent1", success=True)
+        assert monitor.get_unhealthy_agents() == []
+        assert monitor.get_status_summary()["health_percentage"] == 100
+
     def test_query_events_with_filter(self, monitor):
         """Test querying events with filters."""
         monitor.record_event(
@@ -377,6 +603,14 @@ class TestOrchestratorMetrics:
         assert metrics.total_cycles == 0
         assert metrics.uptime_seconds >= 0
 
+    def test_uptime_uses_monotonic_clock(self):
+        """Test that uptime is measured from the monotonic clock."""
+        import time
+
+        metrics = OrchestratorMetrics()
+        metrics._started_monotonic = time.monotonic() - 42
+        assert 42 <= metrics.uptime_seconds < 43
+
     def test_cycle_success_rate(self):
         """Test cycle success rate calculation."""
         metrics = OrchestratorMetrics()
@@ -445,6 +679,186 @@ class TestAgentIntegration:
         results = await orchestrator.execute_scheduled_agents()
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_scheduled_agents_run_concurrently(self, orchestrator):
+        """Test that due agents on the same tick overlap instead of queueing."""
+        import time
+
+        for i in range(3):
+            orchestrator.register_agent(MockAgent(f"Slow{i}", delay_seconds=0.2), 100)
+
+        started = time.monotonic()
+        results = await orchestrator.execute_scheduled_agents()
+
+        assert len(results) == 3
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_scheduled_agents_follow_enable_and_reschedule(self, orchestrator):
+        """Test that the due heap honours disable/enable and manual reschedules."""
+        agent = MockAgent("Periodic")
+        orchestrator.register_agent(agent, interval_seconds=100)
+
+        orchestrator.disable_agent("Periodic")
+        assert await orchestrator.execute_scheduled_agents() == []
+
+        orchestrator.enable_agent("Periodic")
+        assert len(await orchestrator.execute_scheduled_agents()) == 1
+        assert await orchestrator.execute_scheduled_agents() == []
+
+        # An on-demand run reschedules the agent; the superseded entry is ignored
+        await orchestrator.execute_agent("Periodic")
+        assert await orchestrator.execute_scheduled_agents() == []
+        assert agent.run_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sleep_tracks_next_due_schedule(self, orchestrator):
+        """Test that the loop sleeps until the next deadline, capped by check_interval."""
+        assert orchestrator._next_sleep(60.0) == 60.0
+
+        orchestrator.register_agent(MockAgent("Soon"), interval_seconds=5)
+        assert orchestrator._next_sleep(60.0) == 0.05  # Due now
+
+        await orchestrator.execute_scheduled_agents()
+        assert 4 < orchestrator._next_sleep(60.0) <= 5
+        assert orchestrator._next_sleep(1.0) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_of_same_agent_rejected(self, orchestrator):
+        """Test that max_concurrent_runs still rejects overlapping launches."""
+        agent = MockAgent("Slow", delay_seconds=0.05)
+        orchestrator.register_agent(agent, interval_seconds=100)
+
+        first, second = await asyncio.gather(
+            orchestrator.execute_agent("Slow"), orchestrator.execute_agent("Slow")
+        )
+
+        assert first.success is True
+        assert second is None
+        assert agent.run_count == 1
+        assert orchestrator._active_runs["Slow"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejected_scheduled_run_is_not_requeued_as_due(self, orchestrator):
+        """Test that a schedule rejected at max_concurrent_runs waits for the running run."""
+        agent = MockAgent("Slow", delay_seconds=0.05)
+        orchestrator.register_agent(agent, interval_seconds=100)
+
+        run = asyncio.create_task(orchestrator.execute_agent("Slow"))
+        await asyncio.sleep(0)
+        assert await orchestrator.execute_scheduled_agents() == []
+        assert orchestrator._next_sleep(60.0) == 60.0  # Nothing due; no busy loop
+
+        await run
+        assert 99 < orchestrator._next_sleep(1000.0) <= 100
+        assert agent.run_count == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_does_not_spin_while_scheduled_run_is_rejected(self, orchestrator):
+        """Test that the schedule loop idles while a due agent is already running."""
+        orchestrator.register_agent(MockAgent("Slow", delay_seconds=0.5), interval_seconds=100)
+        attempts = []
+        execute_agent = orchestrator.execute_agent
+
+        async def counting_execute(agent_name):
+            attempts.append(agent_name)
+            return await execute_agent(agent_name)
+
+        run = asyncio.create_task(execute_agent("Slow"))
+        await asyncio.sleep(0)
+        orchestrator.execute_agent = counting_execute
+        loop = asyncio.create_task(orchestrator.start(check_interval=60.0))
+        await asyncio.sleep(0.3)
+
+        loop.cancel()
+        await asyncio.gather(loop, return_exceptions=True)
+        await run
+        assert attempts == ["Slow"]
+
+    @pytest.mark.asyncio
+    async def test_unregister_during_run(self, orchestrator):
+        """Test that unregistering a running agent does not break its run."""
+        orchestrator.register_agent(MockAgent("Slow", delay_seconds=0.05), interval_seconds=100)
+
+        run = asyncio.create_task(orchestrator.execute_agent("Slow"))
+        await asyncio.sleep(0)
+        assert orchestrator.unregister_agent("Slow") is True
+
+        result = await run
+        assert result.success is True
+        assert "Slow" not in orchestrator._active_runs
+
+    @pytest.mark.asyncio
+    async def test_background_run_reports_result(self, orchestrator):
+        """Test that background runs return a task ID that resolves to the result."""
+        orchestrator.register_agent(MockAgent("Slow", delay_seconds=0.02))
+        completed = []
+
+        task_id = orchestrator.start_background("Slow", on_complete=completed.append)
+        assert orchestrator.get_task_result(task_id)["status"] == "running"
+        assert orchestrator.start_background("Missing") is None
+
+        await asyncio.sleep(0.05)
+        state = orchestrator.get_task_result(task_id)
+        assert state["agent"] == "Slow"
+        assert state["status"] == "completed"
+        assert state["result"].success is True
+        assert completed == [state["result"]]
+        assert orchestrator.get_task_result("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_background_run_reports_cancellation_and_errors(self, orchestrator):
+        """Test that cancelled or raising background runs are reported, not re-raised."""
+        orchestrator.register_agent(MockAgent("Slow", delay_seconds=1.0))
+        callback_errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: callback_errors.append(context))
+        completed = []
+
+        try:
+            task_id = orchestrator.start_background("Slow", on_complete=completed.append)
+            await asyncio.sleep(0)
+            await orchestrator.stop()
+            await asyncio.sleep(0)
+            assert orchestrator.get_task_result(task_id)["status"] == "cancelled"
+
+            async def raising(agent_name):
+                raise RuntimeError("boom")
+
+            orchestrator.execute_agent = raising
+            task_id = orchestrator.start_background("Slow", on_complete=completed.append)
+            await asyncio.sleep(0.01)
+            state = orchestrator.get_task_result(task_id)
+            assert state["status"] == "error"
+            assert state["error"] == "boom"
+        finally:
+            loop.set_exception_handler(None)
+
+        assert completed == []
+        assert callback_errors == []
+
+    @pytest.mark.asyncio
+    async def test_stop_cleans_up_agents_concurrently(self, orchestrator):
+        """Test that agent cleanups overlap and one failure does not skip others."""
+        import time
+
+        cleaned = []
+
+        class SlowCleanupAgent(MockAgent):
+            async def cleanup(self) -> None:
+                await asyncio.sleep(0.1)
+                if self.should_fail:
+                    raise RuntimeError("cleanup failed")
+                cleaned.append(self.name)
+
+        for name in ("A", "B", "C"):
+            orchestrator.register_agent(SlowCleanupAgent(name, should_fail=name == "B"))
+
+        started = time.monotonic()
+        await orchestrator.stop()
+        assert time.monotonic() - started < 0.25
+        assert sorted(cleaned) == ["A", "C"]
+
     def test_agent_priority_ordering(self, orchestrator):
         """Test agents are ordered by priority."""
         critical = MockAgent("Critical", priority=AgentPriority.CRITICAL)
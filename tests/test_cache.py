@@ -2,7 +2,7 @@
 
 import pytest
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from core.cache import HealthCheckCache, CacheEntry
 from core.utils import CircuitBreaker
 
@@ -36,10 +36,11 @@ class TestCacheEntry:
             indexer_id=1,
             indexer_name="Test",
             success=True,
-            timestamp=utc_now() - timedelta(seconds=100)
+            timestamp=time.monotonic() - 100
         )
         age = entry.age_seconds
         assert 99 <= age <= 101  # Allow 1 second tolerance
+        assert 99 <= (utc_now() - entry.cached_at).total_seconds() <= 101
     
     def test_cache_entry_freshness_fresh(self):
         """Test fresh cache entry."""
@@ -48,7 +49,7 @@ class TestCacheEntry:
             indexer_id=1,
             indexer_name="Test",
             success=True,
-            timestamp=utc_now() - timedelta(seconds=10)
+            timestamp=time.monotonic() - 10
         )
         assert entry.is_fresh(ttl_seconds=300) is True
     
@@ -59,7 +60,7 @@ class TestCacheEntry:
             indexer_id=1,
             indexer_name="Test",
             success=True,
-            timestamp=utc_now() - timedelta(seconds=350)
+            timestamp=time.monotonic() - 350
         )
         assert entry.is_fresh(ttl_seconds=300) is False
 
@@ -132,6 +133,22 @@ class TestHealthCheckCache:
         assert cache.get("radarr", 1) is None
         assert cache.get("radarr", 2) is None
         assert cache.get("sonarr", 1) is not None
+        assert cache.get_stats()["size"] == 1
+        assert set(cache._by_service) == {"sonarr"}
+
+    def test_service_index_follows_removals(self):
+        """Test that evicted and invalidated keys leave the service index."""
+        cache = HealthCheckCache(ttl_seconds=300, max_entries=2)
+        cache.set("radarr", 1, "Index1", True)
+        cache.set("sonarr", 1, "Index2", True)
+        cache.set("sonarr", 2, "Index3", True)  # Evicts radarr/1
+
+        assert set(cache._by_service) == {"sonarr"}
+        cache.invalidate("sonarr", 1)
+        assert cache._by_service == {"sonarr": {("sonarr", 2)}}
+
+        cache.invalidate_service("radarr")  # Nothing cached; no-op
+        assert cache.get("sonarr", 2) is not None
     
     def test_cache_clear(self, cache):
         """Test clearing entire cache."""
@@ -158,6 +175,13 @@ class TestHealthCheckCache:
         assert stats["total_accesses"] == 3
         assert stats["size"] == 1
         assert 66.0 <= stats["hit_rate_percent"] <= 67.0  # 2/3
+        
+        # Unchanged counters reuse the computed rate; new accesses refresh it
+        cached = cache._hit_rate
+        assert cache.get_stats()["hit_rate_percent"] == stats["hit_rate_percent"]
+        assert cache._hit_rate is cached
+        cache.get("radarr", 1)
+        assert cache.get_stats()["hit_rate_percent"] == 75.0
     
     def test_cache_eviction(self):
         """Test LRU eviction when capacity reached."""
@@ -178,6 +202,42 @@ class TestHealthCheckCache:
         assert cache.get("radarr", 2) is not None
         assert cache.get("radarr", 3) is not None
 
+    def test_cache_get_many_and_set_many(self, cache):
+        """Test bulk lookups and stores match the single-key methods."""
+        cache.set_many([
+            ("radarr", 1, "BluRay", True, None),
+            ("sonarr", 2, "TVReleases", False, "timeout"),
+        ])
+        cache.set("radarr", 3, "Stale", True)
+        cache._cache[("radarr", 3)].timestamp -= 1000
+        
+        results = cache.get_many([("radarr", 1), ("sonarr", 2), ("radarr", 3), ("radarr", 9)])
+        assert results[("radarr", 1)].indexer_name == "BluRay"
+        assert results[("sonarr", 2)].error == "timeout"
+        assert results[("radarr", 3)] is None
+        assert results[("radarr", 9)] is None
+        
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+        assert set(cache._by_service) == {"radarr", "sonarr"}
+    
+    def test_cache_eviction_follows_recent_use(self):
+        """Test that reads and rewrites protect an entry from eviction."""
+        cache = HealthCheckCache(ttl_seconds=300, max_entries=2)
+        cache.set("radarr", 1, "Index1", True)
+        cache.set("radarr", 2, "Index2", True)
+
+        # Touch entry 1 so entry 2 becomes least recently used
+        assert cache.get("radarr", 1) is not None
+        cache.set("radarr", 3, "Index3", True)
+        assert cache.get("radarr", 2) is None
+        assert cache.get("radarr", 1) is not None
+
+        # Rewriting an existing key at capacity evicts nothing
+        cache.set("radarr", 3, "Index3", False)
+        assert cache.get_stats()["size"] == 2
+        assert cache.get("radarr", 1) is not None
+
 
 class TestCircuitBreaker:
     """Test circuit breaker resilience pattern."""
@@ -229,3 +289,71 @@ class TestCircuitBreaker:
         # Should allow recovery
         assert cb.can_proceed() is True
         assert cb.is_open is False
+
+
+class TestShutdownHandler:
+    """Test graceful shutdown handler dispatch."""
+    
+    @pytest.mark.asyncio
+    async def test_handlers_run_in_reverse_order(self):
+        """Test that sync and async handlers both run, last registered first."""
+        from core.shutdown import ShutdownHandler
+        
+        calls = []
+        
+        def close_sync() -> None:
+            calls.append("sync")
+        
+        async def close_async() -> None:
+            calls.append("async")
+        
+        handler = ShutdownHandler(timeout_seconds=1)
+        handler.register_shutdown_handler(close_sync)
+        handler.register_shutdown_handler(close_async)
+        await handler.handle_shutdown()
+        
+        assert calls == ["async", "sync"]
+        assert handler.shutdown_event.is_set()
+
+
+class TestRetry:
+    """Test retry decorator."""
+    
+    @pytest.mark.asyncio
+    async def test_retry_shares_decorator_and_retries(self):
+        """Test that identical configs share one decorator and still retry."""
+        from core.utils import retry
+        
+        assert retry(max_attempts=2, delay=0) is retry(max_attempts=2, delay=0)
+        assert retry(max_attempts=2, delay=0) is not retry(max_attempts=3, delay=0)
+        
+        attempts = []
+        
+        @retry(max_attempts=2, delay=0, exceptions=[ValueError])
+        async def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("first attempt fails")
+            return "ok"
+        
+        assert await flaky() == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_accepts_single_exception_class(self):
+        """Test that a bare exception class works like a one-element tuple."""
+        from core.utils import retry
+        
+        assert retry(delay=0, exceptions=ValueError) is retry(delay=0, exceptions=(ValueError,))
+        
+        attempts = []
+        
+        @retry(max_attempts=2, delay=0, exceptions=ValueError)
+        async def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("first attempt fails")
+            return "ok"
+        
+        assert await flaky() == "ok"
+        assert len(attempts) == 2
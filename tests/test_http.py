@@ -1,5 +1,6 @@
 """Unit tests for core.http module."""
 
+import httpx
 import pytest
 
 from core.http import ArrHttpClient
@@ -29,6 +30,48 @@ def test_arr_http_client_instantiation():
     asyncio.run(client.close())
 
 
+@pytest.mark.asyncio
+async def test_arr_http_client_max_connections():
+    """Test that max_connections sizes the pool and keeps every socket alive."""
+    async with ArrHttpClient("http://test.local", "test_key", max_connections=8) as client:
+        pool = client.client._transport._pool
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 8
+        assert pool._keepalive_expiry == 60.0
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        pool = client.client._transport._pool
+        assert pool._max_connections == 64
+        assert pool._max_keepalive_connections == 32
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_shared_client():
+    """Test that services sharing one client keep their own URL and API key."""
+    from core.http import create_http_client
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers["X-Api-Key"]))
+        return httpx.Response(200, json=[])
+
+    shared = create_http_client(transport=httpx.MockTransport(handler))
+    radarr = ArrHttpClient("http://radarr:7878/", "key1", client=shared)
+    sonarr = ArrHttpClient("http://sonarr:8989", "key2", client=shared)
+
+    await radarr._send("GET", "/api/v3/indexer")
+    await sonarr._send("GET", "/api/v3/indexer")
+    await radarr.close()
+
+    assert not shared.is_closed
+    assert seen == [
+        ("http://radarr:7878/api/v3/indexer", "key1"),
+        ("http://sonarr:8989/api/v3/indexer", "key2"),
+    ]
+    await shared.aclose()
+
+
 @pytest.mark.asyncio
 async def test_arr_http_client_close():
     """Test that client closes cleanly."""
@@ -36,3 +79,310 @@ async def test_arr_http_client_close():
     await client.close()
     # After close, aclose is now a no-op
     await client.close()
+
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_parses_by_content_type():
+    """Test that only JSON-labelled responses are JSON-decoded."""
+    request = httpx.Request("GET", "http://test.local/api")
+    json_resp = httpx.Response(200, json={"ok": True}, request=request)
+    text_resp = httpx.Response(
+        200, text="[1, 2]", headers={"content-type": "text/plain"}, request=request
+    )
+
+    bad_json_resp = httpx.Response(
+        200, text="not json", headers={"content-type": "application/json"}, request=request
+    )
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        assert await client._parse_response(json_resp) == {"ok": True}
+        assert await client._parse_response(text_resp) == "[1, 2]"
+        assert await client._parse_response(bad_json_resp) == "not json"
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_max_in_flight():
+    """Test that max_in_flight bounds concurrent requests across callers."""
+    import asyncio
+
+    active = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"id": 1})
+
+    async with ArrHttpClient("http://test.local", "test_key", max_in_flight=2) as client:
+        client.client = httpx.AsyncClient(
+            base_url="http://test.local", transport=httpx.MockTransport(handler)
+        )
+        responses = await asyncio.gather(
+            *[client._send("GET", "/api/v3/indexer") for _ in range(6)]
+        )
+
+    assert [r.status_code for r in responses] == [200] * 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_single_flight_joins_identical_requests():
+    """Test that concurrent requests with the same key share one fetch."""
+    import asyncio
+
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        first, second = await asyncio.gather(
+            client._single_flight(("/api/v3/indexer", None), fetch),
+            client._single_flight(("/api/v3/indexer", None), fetch),
+        )
+        assert first is second
+        assert len(calls) == 1
+        assert client._pending_gets == {}
+
+        # Once finished, the next request fetches again
+        await client._single_flight(("/api/v3/indexer", None), fetch)
+        assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_single_flight_survives_cancelled_sole_caller():
+    """Test that a shared request whose only caller left is cleaned up quietly."""
+    import asyncio
+    import gc
+
+    unretrieved = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("refused")
+
+    try:
+        async with ArrHttpClient("http://test.local", "test_key") as client:
+            caller = asyncio.create_task(client._single_flight(("/api/v3/indexer", None), fetch))
+            await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+
+            await asyncio.sleep(0.03)
+            assert client._pending_gets == {}
+        gc.collect()
+        assert unretrieved == []
+    finally:
+        loop.set_exception_handler(None)
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_get_list_params_skips_coalescing():
+    """Test that list-valued query params are sent uncoalesced instead of failing."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params.get_list("ids"))
+        return httpx.Response(200, json=[])
+
+    assert ArrHttpClient._get_key("/api/v3/indexer", {"ids": [1, 2]}) is None
+    assert ArrHttpClient._get_key("/api/v3/indexer", {"id": 1}) is not None
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await client._get("/api/v3/indexer", {"ids": [1, 2]}) == []
+
+    assert seen == [["1", "2"]]
+
+
+@pytest.mark.asyncio
+async def test_arr_http_client_warm_up_pings_and_tolerates_failures():
+    """Test that warm_up sends a HEAD /ping and never raises."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return httpx.Response(200)
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        client.client = httpx.AsyncClient(
+            base_url="http://test.local", transport=httpx.MockTransport(handler)
+        )
+        await client.warm_up()
+        assert seen == [("HEAD", "/ping")]
+
+    def failing(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async with ArrHttpClient("http://test.local", "test_key") as client:
+        client.client = httpx.AsyncClient(
+            base_url="http://test.local", transport=httpx.MockTransport(failing)
+        )
+        await client.warm_up()
+
+
+@pytest.mark.asyncio
+async def test_validator_probes_arr_services_concurrently(monkeypatch):
+    """Test that the Arr service probes overlap and collect every error."""
+    import asyncio
+    import time
+    from core.validator import ConfigurationValidator
+
+    async def slow_probe(self, name, url, api_key, path):
+        await asyncio.sleep(0.1)
+        return [] if name == "Radarr" else [f"{name} returned status 401"]
+
+    monkeypatch.setattr(ConfigurationValidator, "_probe_service", slow_probe)
+    validator = ConfigurationValidator()
+
+    started = time.monotonic()
+    await validator._validate_arr_services()
+    await validator.aclose()
+    assert time.monotonic() - started < 0.25
+    assert validator.errors == [
+        "Sonarr returned status 401",
+        "Prowlarr returned status 401",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validator_probes_every_discovery_source(monkeypatch):
+    """Test that all discovery sources are probed, each failure a warning."""
+    from config.settings import settings
+    from core import validator as validator_module
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down.example":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200 if request.url.host == "ok.example" else 404)
+
+    real_client = httpx.AsyncClient
+
+    def mock_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(validator_module.httpx, "AsyncClient", mock_client)
+    monkeypatch.setattr(settings, "discovery_enabled", True)
+    monkeypatch.setattr(
+        settings,
+        "discovery_sources",
+        ["http://ok.example/a", "http://missing.example/b", "http://down.example/c"],
+    )
+
+    validator = validator_module.ConfigurationValidator()
+    await validator._validate_discovery_config()
+    await validator.aclose()
+    assert validator.errors == []
+    assert validator.warnings[0] == "Discovery source 2 returned status 404"
+    assert validator.warnings[1].startswith("Discovery source 3 not reachable")
+
+
+@pytest.mark.asyncio
+async def test_validator_arr_probe_uses_shared_client():
+    """Test that Arr probes check the authenticated status endpoint over the shared client."""
+    from core.validator import ConfigurationValidator
+
+    seen = []
+    statuses = {"radarr": 200, "sonarr": 500, "prowlarr": 401}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url), request.headers["X-Api-Key"]))
+        return httpx.Response(statuses[request.url.host], json={"appName": "Arr"})
+
+    validator = ConfigurationValidator()
+    await validator.aclose()
+    validator._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await validator._probe_service(
+        "Radarr", "http://radarr:7878/", "key1", "/api/v3/system/status"
+    ) == []
+    assert await validator._probe_service(
+        "Sonarr", "http://sonarr:8989", "key3", "/api/v3/system/status"
+    ) == ["Sonarr returned status 500"]
+    assert await validator._probe_service(
+        "Prowlarr", "http://prowlarr:9696", "bad", "/api/v1/system/status"
+    ) == ["Prowlarr rejected the API key (status 401)"]
+    await validator.aclose()
+    assert seen == [
+        ("GET", "http://radarr:7878/api/v3/system/status", "key1"),
+        ("GET", "http://sonarr:8989/api/v3/system/status", "key3"),
+        ("GET", "http://prowlarr:9696/api/v1/system/status", "bad"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validator_status_probe_skips_body():
+    """Test that validator probes read the status without consuming the body."""
+    from core.validator import ConfigurationValidator
+
+    read = []
+
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            read.append(1)
+            yield b"x" * 1024
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=Body())
+
+    validator = ConfigurationValidator()
+    await validator.aclose()
+    validator._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await validator._status_of("GET", "http://source.local/list.json") == 200
+    await validator.aclose()
+    assert read == []
+
+
+@pytest.mark.asyncio
+async def test_validator_reuses_recent_result(monkeypatch):
+    """Test that validate_all reuses a fresh result until forced or settings change."""
+    from config.settings import settings
+    from core import validator as validator_module
+
+    runs = []
+
+    async def check(self):
+        runs.append(1)
+        self.warnings.append("slow source")
+
+    monkeypatch.setattr(validator_module, "_last_validation", None)
+    for name in ("_validate_arr_services", "_validate_database", "_validate_discovery_config"):
+        monkeypatch.setattr(validator_module.ConfigurationValidator, name, check)
+
+    async def validate(force=False):
+        validator = validator_module.ConfigurationValidator()
+        try:
+            return await validator.validate_all(force=force)
+        finally:
+            await validator.aclose()
+
+    assert await validate() == (True, [], ["slow source"] * 3)
+    assert await validate() == (True, [], ["slow source"] * 3)
+    assert len(runs) == 3
+
+    await validate(force=True)
+    assert len(runs) == 6
+
+    monkeypatch.setattr(settings, "radarr_url", "http://other-radarr:7878")
+    await validate()
+    assert len(runs) == 9
+
+
+@pytest.mark.asyncio
+async def test_validator_database_ping_succeeds():
+    """Test that the database check pings the configured engine without errors."""
+    from core.validator import ConfigurationValidator
+
+    validator = ConfigurationValidator()
+    await validator._validate_database()
+    await validator.aclose()
+    assert validator.errors == []
@@ -84,6 +84,67 @@ class TestEventLogging:
         assert response.status_code == 200
         data = response.json()
         assert data["events_count"] <= 5
+    
+    def test_event_log_round_trip(self, tmp_path):
+        """Test that logged events are readable back, across close and reopen."""
+        from core.monitoring import EventLog
+        
+        log = EventLog(log_dir=tmp_path)
+        log.log_event("indexer_disabled", "radarr", {"indexer_id": 1}, "WARNING")
+        log.close()
+        log.log_event("health_check_failed", "sonarr", {"indexer_id": 2})
+        
+        events = log.get_recent_events(limit=10)
+        log.close()
+        assert [e["event_type"] for e in events] == [
+            "indexer_disabled",
+            "health_check_failed",
+        ]
+        assert events[0]["details"] == {"indexer_id": 1}
+        assert events[0]["severity"] == "WARNING"
+    
+    def test_event_log_tail_reads_last_events(self, tmp_path, monkeypatch):
+        """Test that recent events come from a backwards read across blocks."""
+        import core.monitoring
+        from core.monitoring import EventLog
+        
+        monkeypatch.setattr(core.monitoring, "_TAIL_BLOCK_SIZE", 64)
+        log = EventLog(log_dir=tmp_path)
+        for i in range(50):
+            log.log_event("health_check", "radarr", {"n": i})
+        log.close()
+        
+        events = log.get_recent_events(limit=5)
+        assert [e["details"]["n"] for e in events] == [45, 46, 47, 48, 49]
+        assert len(log.get_recent_events(limit=500)) == 50
+        assert log.get_recent_events(limit=0) == []
+    
+    def test_event_log_created_lazily(self):
+        """Test that the shared event log is built on first use and then reused."""
+        from core import monitoring
+        
+        assert not hasattr(monitoring, "event_log")
+        assert monitoring.get_event_log() is monitoring.get_event_log()
+
+
+class TestMonitoringClocks:
+    """Test uptime and startup durations use the monotonic clock."""
+    
+    def test_uptime_and_startup_duration_are_monotonic(self):
+        """Test that elapsed times ignore the wall-clock start timestamps."""
+        import time
+        from core.monitoring import MetricsCollector, StartupStatus
+        
+        metrics = MetricsCollector()
+        metrics._start_monotonic = time.monotonic() - 42
+        assert 42 <= metrics.get_metrics()["uptime_seconds"] < 43
+        
+        startup = StartupStatus()
+        startup.mark_startup_start()
+        startup._startup_monotonic -= 5
+        status = startup.get_status()
+        assert 5 <= status["startup_duration_seconds"] < 6
+        assert status["startup_time"] == startup.startup_time.isoformat()
 
 
 class TestAgentEndpoints:
@@ -94,6 +94,124 @@ def test_app_startup_requires_config():
     assert app is not None
 
 
+def test_settings_normalize_urls_and_reject_placeholders(mock_settings):
+    """Test that settings strip URL slashes and reject placeholder keys."""
+    from pydantic import ValidationError
+    from config.settings import Settings
+
+    values = mock_settings.model_dump()
+    settings = Settings(**{**values, "radarr_url": "http://localhost:7878/"})
+    assert settings.radarr_url == "http://localhost:7878"
+
+    with pytest.raises(ValidationError, match="sonarr_api_key"):
+        Settings(**{**values, "sonarr_api_key": "your_sonarr_key"})
+
+    with pytest.raises(ValidationError, match="db_pool_size"):
+        Settings(**{**values, "db_pool_size": 0})
+    with pytest.raises(ValidationError, match="db_max_overflow"):
+        Settings(**{**values, "db_max_overflow": -1})
+
+
+def test_engine_options_match_database_backend():
+    """Test that the engine pool is chosen from the database URL."""
+    from sqlalchemy.pool import NullPool, StaticPool
+    from config.settings import settings
+    from db.session import _engine_options
+
+    assert _engine_options("sqlite+aiosqlite:///:memory:") == {"poolclass": StaticPool}
+    assert _engine_options("sqlite+aiosqlite:///./db/app.db") == {"poolclass": NullPool}
+
+    options = _engine_options("postgresql+asyncpg://u:p@db/app")
+    assert options["pool_size"] >= 1
+    assert options["max_overflow"] == settings.db_max_overflow
+    assert options["connect_args"] == {"server_settings": {"jit": "off"}}
+    assert "connect_args" not in _engine_options("mysql+aiomysql://u:p@db/app")
+
+
+@pytest.mark.asyncio
+async def test_indexer_health_bulk_insert():
+    """Test that bulk_insert writes every row with a timestamp."""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from db.models import Base, IndexerHealth
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rows = [
+        {"service": "radarr", "indexer_id": i, "name": f"idx{i}", "success": i % 2 == 0, "error": None}
+        for i in range(3)
+    ]
+    async with AsyncSession(engine) as session:
+        await IndexerHealth.bulk_insert(session, rows)
+        await IndexerHealth.bulk_insert(session, [])
+        await session.commit()
+        stored = (await session.execute(select(IndexerHealth))).scalars().all()
+
+    await engine.dispose()
+    assert sorted(r.indexer_id for r in stored) == [0, 1, 2]
+    assert all(r.timestamp is not None for r in stored)
+
+
+@pytest.mark.asyncio
+async def test_missing_indexes_added_to_existing_tables():
+    """Test that indexes added since a table was created are built on startup."""
+    from sqlalchemy import inspect, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from db.session import _create_missing_indexes
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE indexer_health (id INTEGER PRIMARY KEY, service VARCHAR(32), "
+            "indexer_id INTEGER, name VARCHAR(128), success BOOLEAN, error VARCHAR(512), "
+            "timestamp DATETIME)"
+        ))
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_create_missing_indexes)  # Idempotent
+        names = await conn.run_sync(
+            lambda c: {i["name"] for i in inspect(c).get_indexes("indexer_health")}
+        )
+    await engine.dispose()
+
+    assert {"idx_service_timestamp", "idx_service_indexer_ts"} <= names
+
+
+def test_scheduler_job_defaults():
+    """Test that scheduled jobs coalesce, never overlap, and drop stale runs."""
+    from main import _create_scheduler
+
+    scheduler = _create_scheduler()
+    assert scheduler._job_defaults == {
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": 60,
+    }
+
+
+@pytest.mark.asyncio
+async def test_lifespan_failure_cancels_startup_tasks():
+    """Test that a failing startup step cancels the pending init_db and closes clients."""
+    import asyncio
+    import main
+
+    async def slow_init_db():
+        await asyncio.sleep(10)
+
+    with patch.object(main, "init_db", slow_init_db), \
+            patch.object(main, "IndexerHealthAgent", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError, match="boom"):
+            async with main.lifespan(app):
+                pass
+
+    orphans = [
+        t for t in asyncio.all_tasks() if t.get_coro().__name__ in ("slow_init_db", "warm_up")
+    ]
+    assert orphans == []
+    assert app.state.http_client.is_closed
+
+
 def test_invalid_service_name(client):
     """Test endpoints with invalid service names."""
     response = client.post("/indexers/invalid/1/test")
@@ -111,3 +229,20 @@ def test_indexer_endpoints_validation(client):
     # May fail with connection error but shouldn't be 400
     assert response.status_code in [200, 500, 502, 503]
 
+
+
+def test_orchestrator_status_endpoint_serializes_status(client):
+    """Test that orchestrator and monitor status are returned as JSON."""
+    from agents.monitor import AgentMonitor
+    from agents.orchestrator import AgentOrchestrator
+
+    with patch.object(app.state, "orchestrator", AgentOrchestrator("Test"), create=True), \
+            patch.object(app.state, "monitor", AgentMonitor(), create=True):
+        response = client.get("/orchestrator/status")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["name"] == "Test"
+
+        response = client.get("/monitor/health")
+        assert response.status_code == 200
+        assert response.json()["total_agents"] == 0